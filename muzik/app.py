@@ -14,7 +14,15 @@ from muzik.commands import soulseek as soulseek_mod
 from muzik.commands.workflow import workflow_cmd
 from muzik.commands.archive import archive_cmd
 from muzik.commands.validate import validate_cmd
-from muzik.tui.app import tui_cmd
+
+
+def tui_cmd() -> None:
+    """Open the Textual workflow UI."""
+    # textual is heavy — import only when the tui command actually runs
+    from muzik.tui.app import tui_cmd as _tui_cmd
+
+    _tui_cmd()
+
 
 app = typer.Typer(
     name="muzik",
@@ -1,17 +1,50 @@
 """music archive <dir> — process existing downloaded files (split + organize)."""
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 import typer
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
 
 from muzik.commands.split import split_cmd
 from muzik.commands.organize import organize_cmd
-from muzik.config import AUDIO_EXTENSIONS, BEETS_CONFIG
-from muzik.core.chapters import find_chapters
+from muzik.config import BEETS_CONFIG
+from muzik.core.chapters import find_chapters, find_chapters_many
+from muzik.core.fsutil import audio_paths, is_empty_dir
 from muzik.ui.console import console, err
 
 
+def _split_one(af: Path, output: Path, jobs: int, keep_source: bool) -> tuple[str, str]:
+    """Split one audio file in a worker process.
+
+    Returns ("ok" | "skip" | "fail", filename). Must stay top-level so it
+    pickles for ProcessPoolExecutor.
+    """
+    chapters = find_chapters(af)
+    if not chapters:
+        return "skip", af.name
+    try:
+        split_cmd(
+            path=af,
+            review=False,
+            jobs=jobs,
+            output=output / af.stem,
+            keep_source=keep_source,
+        )
+    except SystemExit as exc:
+        if exc.code not in (0, None):
+            return "fail", af.name
+    return "ok", af.name
+
+
 def archive_cmd(
     directory: Path = typer.Argument(
         ..., help="Directory of already-downloaded audio files."
@@ -61,6 +94,12 @@ def archive_cmd(
         "--keep-source",
         help="Keep original audio files after splitting.",
     ),
+    parallel_files: int = typer.Option(
+        1,
+        "--parallel-files",
+        "-P",
+        help="Split this many files concurrently (1 = sequential).",
+    ),
     config: Optional[Path] = typer.Option(
         None,
         "--config",
@@ -73,11 +112,7 @@ def archive_cmd(
         err(f"[red]Directory not found: {directory}[/red]")
         raise typer.Exit(1)
 
-    audio_files = [
-        f
-        for f in sorted(directory.iterdir())
-        if f.is_file() and f.suffix.lower() in AUDIO_EXTENSIONS
-    ]
+    audio_files = audio_paths(directory)
 
     if not audio_files:
         console.print(f"[yellow]No audio files found in {directory}[/yellow]")
@@ -93,35 +128,70 @@ def archive_cmd(
         processed = 0
         skipped = 0
 
-        for af in audio_files:
-            chapters = find_chapters(af)
+        if parallel_files > 1 and not dry_run:
+            # Cap inner ffmpeg jobs so concurrent splits don't oversubscribe cores
+            if jobs <= 0:
+                jobs = max(1, (os.cpu_count() or 4) // parallel_files)
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+                console=console,
+            ) as progress:
+                task_id = progress.add_task("Splitting…", total=len(audio_files))
+
+                with ProcessPoolExecutor(max_workers=parallel_files) as pool:
+                    results = pool.map(
+                        _split_one,
+                        audio_files,
+                        [output] * len(audio_files),
+                        [jobs] * len(audio_files),
+                        [keep_source] * len(audio_files),
+                    )
+                    for status, name in results:
+                        if status == "ok":
+                            processed += 1
+                        elif status == "skip":
+                            skipped += 1
+                        else:
+                            err(f"  [red]Split failed for {name}[/red]")
+                        progress.advance(task_id)
+        else:
+            # Probe chapters concurrently up front — each call is I/O bound
+            all_chapters = find_chapters_many(audio_files)
 
-            if not chapters:
-                console.print(f"[dim]  {af.name} — no chapters found, skipping[/dim]")
-                skipped += 1
-                continue
+            for af, chapters in zip(audio_files, all_chapters):
+                if not chapters:
+                    console.print(
+                        f"[dim]  {af.name} — no chapters found, skipping[/dim]"
+                    )
+                    skipped += 1
+                    continue
 
-            console.print(
-                f"\n[cyan]  Splitting:[/cyan] {af.name} "
-                f"([dim]{len(chapters)} tracks[/dim])"
-            )
+                console.print(
+                    f"\n[cyan]  Splitting:[/cyan] {af.name} "
+                    f"([dim]{len(chapters)} tracks[/dim])"
+                )
 
-            if dry_run:
-                console.print(f"  [dim]Would split → {output / af.stem}[/dim]")
-            else:
-                # Delegate to split_cmd (uses a standalone Typer context)
-                try:
-                    split_cmd(
-                        path=af,
-                        review=False,
-                        jobs=jobs,
-                        output=output / af.stem,
-                        keep_source=keep_source,
-                    )
-                    processed += 1
-                except SystemExit as exc:
-                    if exc.code != 0:
-                        err(f"  [red]Split failed for {af.name}[/red]")
+                if dry_run:
+                    console.print(f"  [dim]Would split → {output / af.stem}[/dim]")
+                else:
+                    # Delegate to split_cmd (uses a standalone Typer context)
+                    try:
+                        split_cmd(
+                            path=af,
+                            review=False,
+                            jobs=jobs,
+                            output=output / af.stem,
+                            keep_source=keep_source,
+                        )
+                        processed += 1
+                    except SystemExit as exc:
+                        if exc.code != 0:
+                            err(f"  [red]Split failed for {af.name}[/red]")
 
         console.print(
             f"\n[bold]Split summary:[/bold] {processed} processed, {skipped} skipped"
@@ -129,7 +199,7 @@ def archive_cmd(
 
     # --- Organize phase ---
     if not skip_organize:
-        if not output.exists() or not any(output.iterdir()):
+        if not output.exists() or is_empty_dir(output):
             console.print(
                 f"[yellow]No split output found in {output}, skipping beets.[/yellow]"
             )
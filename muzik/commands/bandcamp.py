@@ -1,5 +1,6 @@
 """muzik bandcamp — Bandcamp collection downloader + beets organize."""
 
+import os
 import webbrowser
 from pathlib import Path
 from typing import Optional
@@ -8,9 +9,12 @@ import typer
 
 from muzik.commands.organize import organize_cmd
 from muzik.config import BEETS_CONFIG, DEFAULT_BANDCAMP_DIR, MUZIK_CONFIG_DIR
-from muzik.core.bandcamp import run as bc_run
+from muzik.core.fsutil import subdir_names
 from muzik.ui.console import console, err
 
+# Bound lazily from muzik.core.bandcamp — aiohttp/bs4 imports are heavy
+bc_run = None
+
 _COOKIES_TXT = MUZIK_CONFIG_DIR / "bandcamp_cookies.txt"
 _USER_FILE = MUZIK_CONFIG_DIR / "bandcamp_user"
 
@@ -31,9 +35,16 @@ Credentials will be stored in [dim]{dir}[/dim]
 # ---------------------------------------------------------------------------
 
 
+def _nonempty(path: Path) -> bool:
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
 def _stored_credentials() -> tuple[Optional[Path], Optional[str]]:
-    cookies = _COOKIES_TXT if _COOKIES_TXT.exists() else None
-    user = _USER_FILE.read_text().strip() if _USER_FILE.exists() else None
+    cookies = _COOKIES_TXT if _nonempty(_COOKIES_TXT) else None
+    user = _USER_FILE.read_text().strip() if _nonempty(_USER_FILE) else None
     return cookies, user or None
 
 
@@ -68,19 +79,33 @@ def _playwright_setup() -> tuple[Path, str]:
         )
         console.print("[green]Login detected![/green]")
 
+        # Kick off the username fetch, then read cookies while the API
+        # response is still in flight — resp.json() blocks only on the body
+        api_page = None
+        resp = None
         try:
             api_page = context.new_page()
-            resp = api_page.goto("https://bandcamp.com/api/fan/2/collection_summary")
+            resp = api_page.goto(
+                "https://bandcamp.com/api/fan/2/collection_summary",
+                wait_until="commit",
+            )
+        except Exception:
+            pass
+
+        raw_cookies = context.cookies(["https://bandcamp.com"])
+
+        try:
             if resp and resp.ok:
                 data = resp.json()
                 username = data.get("fan_data", {}).get("username") or data.get(
                     "username"
                 )
-            api_page.close()
         except Exception:
             pass
+        finally:
+            if api_page is not None:
+                api_page.close()
 
-        raw_cookies = context.cookies(["https://bandcamp.com"])
         browser.close()
 
     if not username:
@@ -93,7 +118,10 @@ def _playwright_setup() -> tuple[Path, str]:
 
     MUZIK_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     write_netscape_cookies(raw_cookies, _COOKIES_TXT)
-    _USER_FILE.write_text(username)
+    # Atomic write so a partial username file never triggers a re-login
+    tmp = _USER_FILE.with_suffix(".tmp")
+    tmp.write_text(username)
+    os.replace(tmp, _USER_FILE)
 
     console.print(f"[green]Cookies saved →[/green] {_COOKIES_TXT}")
     console.print(f"[green]Username saved →[/green] {username}")
@@ -108,6 +136,10 @@ def _ensure_credentials(
     if setup:
         return _playwright_setup()
 
+    # Explicit args fully determine the answer — skip the disk probes
+    if explicit_cookies and explicit_user:
+        return explicit_cookies, explicit_user
+
     stored_cookies, stored_user = _stored_credentials()
     cookies = explicit_cookies or stored_cookies
     user = explicit_user or stored_user
@@ -217,7 +249,11 @@ def bandcamp_cmd(
     console.print(f"[bold cyan]Bandcamp download:[/bold cyan] {username}")
     console.print(f"[dim]Format: {format} · Output: {output.resolve()}[/dim]")
 
-    before = {d for d in output.iterdir() if d.is_dir()} if output.exists() else set()
+    before = subdir_names(output)
+
+    global bc_run
+    if bc_run is None:
+        from muzik.core.bandcamp import run as bc_run
 
     bc_run(
         username=username,
@@ -232,13 +268,15 @@ def bandcamp_cmd(
     if no_organize or dry_run:
         return
 
-    after_dirs = {d for d in output.iterdir() if d.is_dir()}
-    new_dirs = sorted(after_dirs - before)
+    after = subdir_names(output)
+    new_dirs = sorted(output / name for name in after - before)
 
     if not new_dirs:
         new_dirs = [output]
 
     console.print(f"\n[bold]Organize[/bold] — {len(new_dirs)} director(ies) via beets")
+    # Imports run serially on purpose: import_paths holds a module-level
+    # lock for the whole beet run, so pooled workers would only queue up
     for d in new_dirs:
         console.print(f"  beet import [dim]{d}[/dim]")
         try:
@@ -1,5 +1,6 @@
 """music cache [list|clear|size|clean] — cache manager."""
 
+import datetime
 from typing import Optional
 
 import typer
@@ -12,21 +13,27 @@ from muzik.ui.console import console, err
 app = typer.Typer(help="Manage the muzik cache.")
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _human_size(n: int) -> str:
-    value = float(n)
-    for unit in ("B", "KB", "MB", "GB"):
-        if value < 1024:
-            return f"{value:.1f} {unit}"
-        value /= 1024
-    return f"{value:.1f} TB"
+    # Pick the unit with int shifts; divide once at the end for the decimal
+    scaled = n
+    i = 0
+    while scaled >= 1024 and i < 4:
+        scaled >>= 10
+        i += 1
+    return f"{n / (1 << (10 * i)):.1f} {_UNITS[i]}"
 
 
 @app.command("list")
 def cache_list() -> None:
     """List all cached items with size and modification date."""
-    files = cache_mod.list_all()
+    entries = sorted(
+        cache_mod.iter_all(), key=lambda e: e.stat().st_mtime, reverse=True
+    )
 
-    if not files:
+    if not entries:
         console.print(f"[dim]Cache is empty.[/dim]  ({CACHE_DIR})")
         return
 
@@ -41,20 +48,21 @@ def cache_list() -> None:
     table.add_column("Modified")
     table.add_column("Ext", style="dim")
 
-    import datetime
-
-    for p in files:
-        stem = p.stem
-        ext = p.suffix.lstrip(".")
-        size = _human_size(p.stat().st_size)
-        mtime = datetime.datetime.fromtimestamp(p.stat().st_mtime)
-        modified = mtime.strftime("%Y-%m-%d %H:%M")
+    _fromts = datetime.datetime.fromtimestamp
+    total = 0
+
+    for entry in entries:
+        stem, dot, ext = entry.name.rpartition(".")
+        if not dot:
+            stem, ext = entry.name, ""
+        st = entry.stat()
+        total += st.st_size
+        size = _human_size(st.st_size)
+        modified = _fromts(st.st_mtime).strftime("%Y-%m-%d %H:%M")
         table.add_row(stem, size, modified, ext)
 
     console.print(table)
-    console.print(
-        f"[dim]Total: {len(files)} file(s), {_human_size(cache_mod.total_size())}[/dim]"
-    )
+    console.print(f"[dim]Total: {len(entries)} file(s), {_human_size(total)}[/dim]")
 
 
 @app.command("clear")
@@ -74,12 +82,7 @@ def cache_clear(
             p.unlink(missing_ok=True)
         console.print(f"[green]Cleared {len(files)} cache entries.[/green]")
     else:
-        # Try all extensions
-        removed = False
-        for ext in ("txt", "json"):
-            if cache_mod.delete(key, ext):
-                removed = True
-        if removed:
+        if cache_mod.delete_any(key):
             console.print(f"[green]Cleared cache entry: {key}[/green]")
         else:
             err(f"[yellow]Cache entry not found: {key}[/yellow]")
@@ -88,10 +91,9 @@ def cache_clear(
 @app.command("size")
 def cache_size() -> None:
     """Show total cache directory size."""
-    files = cache_mod.list_all()
-    total = cache_mod.total_size()
+    count, total = cache_mod.count_and_size()
     console.print(
-        f"[bold]Cache:[/bold] {CACHE_DIR}\n  {len(files)} file(s), {_human_size(total)}"
+        f"[bold]Cache:[/bold] {CACHE_DIR}\n  {count} file(s), {_human_size(total)}"
     )
 
 
@@ -1,5 +1,6 @@
 """music config [show|set-library|edit] — manage beets config."""
 
+import functools
 import os
 import subprocess
 import shutil
@@ -11,6 +12,11 @@ import yaml
 from rich.syntax import Syntax
 from rich.table import Table
 
+try:  # libyaml-backed loader/dumper when available (5-10x faster)
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
 from muzik.config import (
     BEETS_CONFIG,
     DEFAULT_SOULSEEK_DIR,
@@ -27,20 +33,25 @@ app = typer.Typer(help="Manage beets configuration.")
 # ---------------------------------------------------------------------------
 
 
+def _load_config_text(text: str) -> dict:
+    return yaml.load(text, Loader=_Loader) or {}
+
+
 def _load_config(path: Path) -> dict:
     if not path.exists():
         return {}
-    return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return _load_config_text(path.read_text(encoding="utf-8"))
 
 
 def _save_config(path: Path, data: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
-        yaml.dump(data, default_flow_style=False, allow_unicode=True),
+        yaml.dump(data, Dumper=_Dumper, default_flow_style=False, allow_unicode=True),
         encoding="utf-8",
     )
 
 
+@functools.lru_cache(maxsize=1)
 def _find_editor() -> str:
     for var in ("EDITOR", "VISUAL"):
         editor = os.environ.get(var, "").strip()
@@ -78,7 +89,8 @@ def config_show(
         "Exists", "[green]yes[/green]" if cfg_path.exists() else "[red]no[/red]"
     )
 
-    data = _load_config(cfg_path)
+    raw = cfg_path.read_text(encoding="utf-8") if cfg_path.exists() else ""
+    data = _load_config_text(raw)
     table.add_row("library dir", str(data.get("directory", "[dim]not set[/dim]")))
     table.add_row("library db", str(data.get("library", "[dim]not set[/dim]")))
     table.add_row(
@@ -92,7 +104,6 @@ def config_show(
 
     if data:
         console.print()
-        raw = yaml.dump(data, default_flow_style=False, allow_unicode=True)
         console.print(Syntax(raw, "yaml", theme="ansi_dark", line_numbers=False))
 
     soulseek = get_slskd_settings()
@@ -4,15 +4,13 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.table import Table
 
-from muzik.config import DEFAULT_DOWNLOAD_DIR
-from muzik.core.chapters import find_chapters
+from muzik.config import AUDIO_EXTENSIONS, DEFAULT_DOWNLOAD_DIR
+from muzik.core.chapters import find_chapters_many
 from muzik.core.runner import run_streaming
 from muzik.core.sources.youtube import (
     build_download_command,
     find_audio_by_id,
-    new_audio_files,
     youtube_id,
 )
 from muzik.ui.console import console, err
@@ -59,11 +57,13 @@ def download_cmd(
         hidden=True,
         help="yt-dlp download archive for deduplication.",
     ),
-) -> None:
+) -> list[Path]:
     """Download audio from YouTube, saving [ID] in the filename for cache compatibility.
 
     After downloading, reports whether each file is a single track or an album
-    with chapter markers, so you know what to run next.
+    with chapter markers, so you know what to run next. Returns the audio
+    files this run produced (or found via the ID fallback), so callers such
+    as the workflow never need to diff the output directory.
     """
     output.mkdir(parents=True, exist_ok=True)
 
@@ -75,13 +75,25 @@ def download_cmd(
         archive_file=archive_file,
     )
 
+    # Have yt-dlp announce each finished file instead of diffing the
+    # directory before/after — O(new files) rather than O(dir size).
+    # --print implies --quiet, so --progress keeps the [download] lines
+    # that feed run_streaming's Live display.
+    cmd[-1:-1] = ["--print", "after_move:filepath", "--no-simulate", "--progress"]
+
     console.print(f"[bold cyan]Downloading:[/bold cyan] {url}")
     console.print(f"[dim]Output: {output.resolve()}[/dim]")
 
-    # Snapshot existing files so we only report newly downloaded ones
-    before = set(output.glob("*")) if output.exists() else set()
+    manifest: list[Path] = []
+
+    def _collect(line: str) -> None:
+        p = Path(line)
+        if not p.is_absolute():
+            p = output / line
+        if p.suffix.lower() in AUDIO_EXTENSIONS and p.exists():
+            manifest.append(p)
 
-    rc = run_streaming(cmd, cwd=output, label="yt-dlp")
+    rc = run_streaming(cmd, cwd=output, label="yt-dlp", line_callback=_collect)
 
     if rc != 0:
         err(f"[red]yt-dlp exited with code {rc}[/red]")
@@ -90,8 +102,7 @@ def download_cmd(
     console.print(f"[green]Download complete → {output.resolve()}[/green]")
 
     # ── Post-download scenario report ─────────────────────────────────────
-    after = set(output.glob("*")) if output.exists() else set()
-    new_audio = new_audio_files(before, after)
+    new_audio = sorted(set(manifest))
 
     # yt-dlp skips re-downloading existing files — fall back to ID-based lookup
     if not new_audio and output.exists():
@@ -100,7 +111,10 @@ def download_cmd(
             new_audio = find_audio_by_id(output, yt_id)
 
     if not new_audio:
-        return
+        return []
+
+    # Imported here so the common nothing-new path skips the table cost
+    from rich.table import Table
 
     table = Table(
         title="Downloaded files",
@@ -112,9 +126,10 @@ def download_cmd(
     table.add_column("Scenario", width=28)
     table.add_column("Next step", overflow="fold")
 
-    for af in new_audio:
-        chapters = find_chapters(af)
-        n = len(chapters)
+    # Probe chapters concurrently — each call is subprocess/file I/O bound
+    chapter_counts = [len(chapters) for chapters in find_chapters_many(new_audio)]
+
+    for af, n in zip(new_audio, chapter_counts):
         scenario = _scenario_label(n)
         if n:
             next_step = f"music split {af.name!r} [--review]"
@@ -123,3 +138,4 @@ def download_cmd(
         table.add_row(af.name, scenario, f"[dim]{next_step}[/dim]")
 
     console.print(table)
+    return new_audio
@@ -78,11 +78,14 @@ def import_cmd(
     """
     beets_cfg = config or BEETS_CONFIG
 
-    if not directory.exists():
+    if not directory.is_dir():
         err(f"[red]Directory not found: {directory}[/red]")
         raise typer.Exit(1)
 
-    if not beets_cfg.exists():
+    # Stat the config once — reusing the answer avoids a race between the
+    # warning and the ImportOptions decision below
+    cfg_exists = beets_cfg.exists()
+    if not cfg_exists:
         err(
             f"[yellow]Beets config not found at {beets_cfg}.[/yellow] "
             "Run [bold]muzik init[/bold] to create one."
@@ -95,7 +98,7 @@ def import_cmd(
         import_paths(
             ImportOptions(
                 paths=[directory],
-                config_path=beets_cfg if beets_cfg.exists() else None,
+                config_path=beets_cfg if cfg_exists else None,
                 copy=copy,
                 link=link,
                 move=not copy and not link,
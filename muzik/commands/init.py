@@ -1,8 +1,5 @@
 """muzik init — create app directories and configure beets for use with muzik."""
 
-import re
-
-
 from muzik.config import (
     BEETS_CONFIG,
     CACHE_DIR,
@@ -63,32 +60,44 @@ def _configure_beets() -> None:
         console.print(f"  Beets cfg  {cfg}  [green]created[/green]")
         return
 
-    text = cfg.read_text()
+    # Decide "nothing to do" on raw bytes — bytes substring search runs in C
+    # and skips the UTF-8 decode; decode only when we actually mutate
+    blob = cfg.read_bytes()
 
-    if "move:" in text and "duplicate_action" in text and "none_rec_action" in text:
+    if b"move:" in blob and b"duplicate_action" in blob and b"none_rec_action" in blob:
         console.print(
             f"  Beets cfg  {cfg}  [dim]import defaults already set — skipped[/dim]"
         )
         return
 
-    # Insert after an existing `import:` line if present
-    if re.search(r"^import\s*:", text, re.MULTILINE):
-        missing = []
-        if not re.search(r"^\s+move\s*:", text, re.MULTILINE):
-            missing.append("  move: yes")
-        if not re.search(r"^\s+duplicate_action\s*:", text, re.MULTILINE):
-            missing.append("  duplicate_action: skip")
-        if not re.search(r"^\s+none_rec_action\s*:", text, re.MULTILINE):
-            missing.append("  none_rec_action: asis")
-
-        if missing:
-            text = re.sub(
-                r"(^import\s*:[ \t]*$)",
-                "\\1\n" + "\n".join(missing),
-                text,
-                count=1,
-                flags=re.MULTILINE,
+    text = blob.decode("utf-8")
+
+    # One pass over the lines: find the `import:` line and which required
+    # keys already exist, then splice the missing ones in right after it
+    lines = text.splitlines()
+    import_idx = None
+    present = set()
+    for i, line in enumerate(lines):
+        if line[:1] in (" ", "\t"):
+            key, sep, _ = line.strip().partition(":")
+            if sep:
+                present.add(key.rstrip())
+        elif import_idx is None and line.startswith("import"):
+            if line[6:].lstrip().startswith(":"):
+                import_idx = i
+
+    if import_idx is not None:
+        missing = [
+            f"  {key}: {value}"
+            for key, value in (
+                ("move", "yes"),
+                ("duplicate_action", "skip"),
+                ("none_rec_action", "asis"),
             )
+            if key not in present
+        ]
+        lines[import_idx + 1 : import_idx + 1] = missing
+        text = "\n".join(lines) + "\n"
     else:
         text = text.rstrip("\n") + "\n\n" + _IMPORT_BLOCK
 
@@ -1,5 +1,6 @@
 """music organize <dir> — beets tagging and importing."""
 
+import functools
 import sys
 from pathlib import Path
 from typing import Optional
@@ -13,55 +14,38 @@ from muzik.core.runner import run_passthrough
 from muzik.ui.console import console, err
 
 
+@functools.cache
 def _beet_bin() -> str:
     """Return the path to the beet binary in the same venv as this Python."""
     beet = Path(sys.executable).parent / "beet"
     return str(beet) if beet.exists() else "beet"
 
 
-def _beet_command(
+def _beet_write_command(
     directory: Path,
     *,
-    tag_only: bool,
     dry_run: bool,
     config: Optional[Path],
 ) -> list[str]:
     cmd = [_beet_bin()]
-    if config and config.exists():
+    if config:
         cmd += ["-c", str(config)]
+    cmd.append("write")
+    if not dry_run:
+        cmd.append("--yes")
+    cmd.append(str(directory))
+    return cmd
 
-    if tag_only:
-        subcmd = ["write"]
-        if not dry_run:
-            subcmd.append("--yes")
-        return cmd + subcmd + [str(directory)]
-
-    subcmd = ["import", "--incremental", "--move"]
-    if dry_run:
-        subcmd.append("--pretend")
-    return cmd + subcmd + [str(directory)]
 
-
-def _run_beet_passthrough(
+def _run_beet_write(
     directory: Path,
     *,
-    tag_only: bool,
     dry_run: bool,
     config: Optional[Path],
 ) -> None:
-    if tag_only:
-        console.print(f"[bold]beet write[/bold] (tag-only) {directory}")
-    else:
-        console.print(f"[bold]beet import[/bold] {directory}")
+    console.print(f"[bold]beet write[/bold] (tag-only) {directory}")
 
-    rc = run_passthrough(
-        _beet_command(
-            directory,
-            tag_only=tag_only,
-            dry_run=dry_run,
-            config=config,
-        )
-    )
+    rc = run_passthrough(_beet_write_command(directory, dry_run=dry_run, config=config))
     if rc != 0:
         err(f"[red]beet exited with code {rc}[/red]")
         raise typer.Exit(rc)
@@ -103,11 +87,13 @@ def organize_cmd(
     """
     beets_cfg = config or BEETS_CONFIG
 
-    if not directory.exists():
+    if not directory.is_dir():
         err(f"[red]Directory not found: {directory}[/red]")
         raise typer.Exit(1)
 
-    if not beets_cfg.exists():
+    # Stat the config once and branch off the cached answer below
+    cfg_exists = beets_cfg.exists()
+    if not cfg_exists:
         err(
             f"[yellow]Beets config not found at {beets_cfg}.[/yellow] "
             "Run [bold]muzik init[/bold] to create one."
@@ -115,11 +101,10 @@ def organize_cmd(
         # Don't abort — beet itself will handle the missing config
 
     if tag_only:
-        _run_beet_passthrough(
+        _run_beet_write(
             directory,
-            tag_only=tag_only,
             dry_run=dry_run,
-            config=beets_cfg,
+            config=beets_cfg if cfg_exists else None,
         )
         console.print("[green]beet finished.[/green]")
         return
@@ -129,7 +114,7 @@ def organize_cmd(
         import_paths(
             ImportOptions(
                 paths=[directory],
-                config_path=beets_cfg if beets_cfg.exists() else None,
+                config_path=beets_cfg if cfg_exists else None,
                 move=True,
                 dry_run=dry_run,
                 incremental=True,
@@ -1,20 +1,14 @@
 """music split <path> — ffmpeg chapter splitter with optional interactive review."""
 
+import asyncio
+import functools
 import os
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.progress import (
-    BarColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 
 from muzik.core import cache as cache_mod
 from muzik.core.audio import extract_metadata
@@ -23,58 +17,244 @@ from muzik.ui.chapter_editor import display_chapter_table, edit_chapters
 from muzik.ui.console import console, err
 
 
+@functools.cache
+def _progress_columns() -> tuple:
+    """Build the Rich progress columns once, on first use.
+
+    rich.progress is a heavy import, so it is deferred until split actually
+    runs; column construction is introspection-heavy, so the tuple is cached
+    for workflow runs that split repeatedly. Columns hold no per-run state.
+    """
+    from rich.progress import (
+        BarColumn,
+        SpinnerColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    return (
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        TimeElapsedColumn(),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
 
-def _split_track(
+def _album_args(
+    audio_path: Path, metadata: dict
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Build the per-album ffmpeg argv prefix and suffix once."""
+    prefix = (
+        "ffmpeg",
+        "-loglevel",
+        "error",
+        "-i",
+        str(audio_path),
+        "-nostdin",
+        "-y",
+    )
+    suffix = (
+        "-vn",
+        "-c:a",
+        "copy",
+        "-metadata",
+        f"artist={metadata['artist']}",
+        "-metadata",
+        f"album={metadata['album']}",
+        "-metadata",
+        f"date={metadata['year']}",
+    )
+    return prefix, suffix
+
+
+def _split_args(
+    prefix: tuple[str, ...],
+    suffix: tuple[str, ...],
     audio_path: Path,
     output_dir: Path,
     chapter: Chapter,
-    metadata: dict,
     track_count: int,
-) -> tuple[bool, str]:
+) -> list[str]:
+    """Splice the per-chapter slots into the shared album argv."""
+    safe_title = safe_filename(chapter.title)
+    out_path = output_dir / f"{chapter.index:02d}-{safe_title}{audio_path.suffix}"
+
+    end_ts = chapter.end_ts
+    return [
+        *prefix,
+        "-ss",
+        chapter.start_ts,
+        *(("-to", end_ts) if end_ts is not None else ()),
+        *suffix,
+        "-metadata",
+        f"title={chapter.title}",
+        "-metadata",
+        f"track={chapter.index}/{track_count}",
+        str(out_path),
+    ]
+
+
+async def _split_track(
+    prefix: tuple[str, ...],
+    suffix: tuple[str, ...],
+    audio_path: Path,
+    output_dir: Path,
+    chapter: Chapter,
+    track_count: int,
+) -> tuple[bool, str, str]:
     """Split one chapter from *audio_path* using ffmpeg.
 
-    Returns (success, chapter_title).
+    Returns (success, chapter_title, error_detail).
     """
-    safe_title = safe_filename(chapter.title)
-    out_path = output_dir / f"{chapter.index:02d}-{safe_title}{audio_path.suffix}"
+    cmd = _split_args(prefix, suffix, audio_path, output_dir, chapter, track_count)
+
+    # Drop stdout at the kernel; keep stderr only to report failures
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    _, stderr = await proc.communicate()
+    if proc.returncode == 0:
+        return True, chapter.title, ""
+    detail = stderr.decode("utf-8", errors="replace").strip()[-200:]
+    return False, chapter.title, detail
+
 
+def _contiguous(chapters: list[Chapter]) -> bool:
+    """True when chapters start at 0:00, run back-to-back, and only the
+    final end is open — the shape the segment muxer can split exactly.
+
+    A single chapter is excluded: it would produce an empty
+    ``-segment_times`` list, which ffmpeg rejects."""
+    if len(chapters) < 2 or chapters[0].start != 0:
+        return False
+    for prev, nxt in zip(chapters, chapters[1:]):
+        if prev.end != nxt.start:
+            return False
+    return chapters[-1].end is None
+
+
+def _split_segments(
+    audio_path: Path,
+    output_dir: Path,
+    chapters: list[Chapter],
+    metadata: dict,
+) -> Optional[str]:
+    """Split every chapter in a single ffmpeg segment-muxer pass.
+
+    One source open and one container parse instead of one per chapter.
+    The segment muxer applies one shared metadata set, so each numbered
+    segment is then remuxed (stream copy, no re-encode) into its final
+    track name with the per-track title and track-number tags — cheap
+    next to decoding the multi-hour source once per chapter.
+    Returns None on success, or ffmpeg's stderr tail on failure (with any
+    partial outputs removed so a fallback starts clean).
+    """
+    suffix = audio_path.suffix
+    pattern = output_dir / f"%03d{suffix}"
     cmd = [
         "ffmpeg",
+        "-loglevel",
+        "error",
         "-i",
         str(audio_path),
         "-nostdin",
         "-y",
-        "-ss",
-        chapter.start_ts,
-    ]
-    if chapter.end is not None:
-        end_ts = chapter.end_ts
-        if end_ts is not None:
-            cmd.extend(["-to", end_ts])
-
-    cmd += [
+        "-map",
+        "0:a",
         "-vn",
         "-c:a",
         "copy",
-        "-metadata",
-        f"title={chapter.title}",
+        "-f",
+        "segment",
+        "-segment_times",
+        ",".join(str(ch.end) for ch in chapters[:-1]),
+        "-reset_timestamps",
+        "1",
         "-metadata",
         f"artist={metadata['artist']}",
         "-metadata",
         f"album={metadata['album']}",
         "-metadata",
         f"date={metadata['year']}",
-        "-metadata",
-        f"track={chapter.index}/{track_count}",
-        str(out_path),
+        str(pattern),
     ]
 
-    result = subprocess.run(cmd, capture_output=True)
-    return result.returncode == 0, chapter.title
+    def _cleanup() -> None:
+        for i, ch in enumerate(chapters):
+            (output_dir / f"{i:03d}{suffix}").unlink(missing_ok=True)
+            safe_title = safe_filename(ch.title)
+            (output_dir / f"{ch.index:02d}-{safe_title}{suffix}").unlink(
+                missing_ok=True
+            )
+
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        _cleanup()
+        return result.stderr.decode("utf-8", errors="replace").strip()[-200:]
+
+    for i, ch in enumerate(chapters):
+        safe_title = safe_filename(ch.title)
+        tag_cmd = [
+            "ffmpeg",
+            "-loglevel",
+            "error",
+            "-i",
+            str(output_dir / f"{i:03d}{suffix}"),
+            "-nostdin",
+            "-y",
+            "-c",
+            "copy",
+            "-metadata",
+            f"title={ch.title}",
+            "-metadata",
+            f"track={ch.index}/{len(chapters)}",
+            str(output_dir / f"{ch.index:02d}-{safe_title}{suffix}"),
+        ]
+        result = subprocess.run(
+            tag_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        if result.returncode != 0:
+            _cleanup()
+            return result.stderr.decode("utf-8", errors="replace").strip()[-200:]
+        (output_dir / f"{i:03d}{suffix}").unlink()
+    return None
+
+
+async def _split_all(
+    audio_path: Path,
+    output_dir: Path,
+    chapters: list[Chapter],
+    metadata: dict,
+    jobs: int,
+    on_done,
+) -> list[tuple[str, str]]:
+    """Run all chapter splits with at most *jobs* concurrent ffmpeg processes.
+
+    A single event loop drives every subprocess — no thread per job.
+    """
+    sem = asyncio.Semaphore(jobs)
+    failed: list[tuple[str, str]] = []
+    prefix, suffix = _album_args(audio_path, metadata)
+
+    async def _one(ch: Chapter) -> None:
+        async with sem:
+            ok, title, detail = await _split_track(
+                prefix, suffix, audio_path, output_dir, ch, len(chapters)
+            )
+        if not ok:
+            failed.append((title, detail))
+        on_done()
+
+    await asyncio.gather(*(_one(ch) for ch in chapters))
+    return failed
 
 
 # ---------------------------------------------------------------------------
@@ -178,35 +358,40 @@ def split_cmd(
     )
     console.print(f"[dim]  Output: {out_dir}[/dim]")
 
-    failed: list[str] = []
+    from rich.progress import Progress
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
+    with Progress(*_progress_columns(), console=console) as progress:
         task_id = progress.add_task("Splitting…", total=len(chapters))
 
-        with ThreadPoolExecutor(max_workers=jobs) as pool:
-            futures = {
-                pool.submit(
-                    _split_track, path, out_dir, ch, metadata, len(chapters)
-                ): ch
-                for ch in chapters
-            }
-            for future in as_completed(futures):
-                ok, title = future.result()
-                if not ok:
-                    failed.append(title)
-                progress.advance(task_id)
+        failed: Optional[list[tuple[str, str]]] = None
+        if _contiguous(chapters):
+            detail = _split_segments(path, out_dir, chapters, metadata)
+            if detail is None:
+                progress.advance(task_id, len(chapters))
+                failed = []
+            else:
+                err(
+                    "[yellow]Segment pass failed — retrying per chapter.[/yellow]"
+                    f" [dim]{detail}[/dim]"
+                )
+
+        if failed is None:
+            # Irregular boundaries (gaps/overlaps) need explicit -ss/-to cuts
+            failed = asyncio.run(
+                _split_all(
+                    path,
+                    out_dir,
+                    chapters,
+                    metadata,
+                    jobs,
+                    on_done=lambda: progress.advance(task_id),
+                )
+            )
 
     if failed:
         err(f"[red]Failed to split {len(failed)} track(s):[/red]")
-        for title in failed:
-            err(f"  [red]• {title}[/red]")
+        for title, detail in failed:
+            err(f"  [red]• {title}[/red]" + (f" [dim]{detail}[/dim]" if detail else ""))
         raise typer.Exit(1)
 
     console.print(f"[green]✓ {len(chapters)} tracks → {out_dir}[/green]")
@@ -215,10 +400,16 @@ def split_cmd(
     if cache_key:
         cache_mod.set(cache_key, str(out_dir))
 
-    # Clean up source files unless --keep-source
+    # Clean up source files unless --keep-source. Plain os.unlink with the
+    # pre-built sidecar strings: one syscall per file, no stat-then-unlink
     if not keep_source:
-        path.unlink(missing_ok=True)
-        for ext in (".chapters.txt", ".info.json", ".metadata.txt"):
-            sidecar = base.with_suffix(ext)
-            sidecar.unlink(missing_ok=True)
+        base_str = str(base)
+        sidecars = (
+            base_str + ext for ext in (".chapters.txt", ".info.json", ".metadata.txt")
+        )
+        for target in (str(path), *sidecars):
+            try:
+                os.unlink(target)
+            except FileNotFoundError:
+                pass
         console.print("[dim]Source files removed.[/dim]")
@@ -1,17 +1,69 @@
 """music validate <path> — audio/chapters/metadata file validator."""
 
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 import typer
-from rich.table import Table
 
 from muzik.config import AUDIO_EXTENSIONS
-from muzik.core.audio import probe
-from muzik.core.chapters import parse_chapters_txt
+from muzik.core.audio import probe_cached
+from muzik.core.chapters import CHAPTER_LINE_RE, parse_chapters_txt
 from muzik.core.metadata import read_muzik_metadata
 from muzik.core.quality import is_lossless, quality_from_name
 from muzik.ui.console import console, err
 
+# File kinds, classified once per name so the hot loop never re-derives
+# suffixes
+_KIND_AUDIO, _KIND_CHAPTERS, _KIND_INFO, _KIND_MUZIK = range(4)
+
+# One alternation pass in the regex engine instead of several endswith /
+# splitext checks per filename; audio extensions match case-insensitively
+# like the old .lower() comparison did
+_CLASSIFY_RE = re.compile(
+    r"(?P<chapters>\.chapters\.txt)$"
+    r"|(?P<info>\.info\.json)$"
+    r"|(?P<muzik>\.muzik\.json)$"
+    r"|(?P<audio>(?i:\.(?:"
+    + "|".join(sorted(ext.lstrip(".") for ext in AUDIO_EXTENSIONS))
+    + r")))$"
+)
+_KIND_BY_GROUP = {
+    "chapters": _KIND_CHAPTERS,
+    "info": _KIND_INFO,
+    "muzik": _KIND_MUZIK,
+    "audio": _KIND_AUDIO,
+}
+
+
+def _kind(name: str) -> int | None:
+    m = _CLASSIFY_RE.search(name)
+    if m is None:
+        return None
+    assert m.lastgroup is not None  # every alternative is a named group
+    return _KIND_BY_GROUP[m.lastgroup]
+
+
+def _walk_relevant(root: Path, recursive: bool) -> Iterator[tuple[Path, int]]:
+    """Yield (file, kind) pairs under *root*, filtering during the walk.
+
+    Never materializes the full (possibly huge) directory tree.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                else:
+                    kind = _kind(entry.name)
+                    if kind is not None:
+                        yield Path(entry.path), kind
+
 
 def _metadata_quality_details(data: dict) -> tuple[str, list[str]]:
     details: list[str] = []
@@ -92,6 +144,99 @@ def _album_completeness_warnings(sidecar: Path, metadata: dict) -> list[str]:
     return []
 
 
+def _has_any_chapter_line(path: Path, max_bytes: int = 4096) -> bool:
+    """Cheap sniff: does the head of *path* contain a valid chapter line?"""
+    with open(path, "rb") as fh:
+        head = fh.read(max_bytes)
+    lines = head.decode("utf-8", errors="replace").splitlines()
+    if len(head) == max_bytes and lines:
+        # The last line may be truncated mid-read — don't judge it
+        lines.pop()
+    return any(CHAPTER_LINE_RE.match(line.strip()) for line in lines)
+
+
+def _validate_one(f: Path, kind: int, verbose: bool) -> tuple[str, str, str]:
+    """Validate a single file.
+
+    Returns ``(file_type, result, details)`` where result is ``"ok"``,
+    ``"warn"``, or ``"fail"``. Pure per-file work — safe to run from a
+    thread pool.
+    """
+    details = ""
+    file_type = ""
+    warnings: list[str] = []
+
+    try:
+        if kind == _KIND_AUDIO:
+            file_type = "audio"
+            data = probe_cached(f)
+            metadata = read_muzik_metadata(f)
+            if verbose:
+                fmt = data.get("format", {})
+                streams = data.get("streams", [{}])
+                codec = streams[0].get("codec_name", "?") if streams else "?"
+                dur = float(fmt.get("duration", 0))
+                mm, ss = divmod(int(dur), 60)
+                hh, mm = divmod(mm, 60)
+                quality_details, warnings = _audio_quality_details(f, metadata)
+                details = (
+                    f"codec={codec} dur={hh:02d}:{mm:02d}:{ss:02d} {quality_details}"
+                )
+            elif metadata is None:
+                warnings.append("metadata sidecar missing")
+
+        elif kind == _KIND_CHAPTERS:
+            file_type = "chapters"
+            if verbose:
+                chapters = parse_chapters_txt(f)
+                if not chapters:
+                    raise ValueError("No valid chapter lines found")
+                details = f"{len(chapters)} chapters"
+            elif not _has_any_chapter_line(f) and not parse_chapters_txt(f):
+                # Full parse only when the head sniff finds nothing —
+                # a valid line could still sit past the first 4 KB
+                raise ValueError("No valid chapter lines found")
+
+        elif kind == _KIND_INFO:
+            file_type = "info.json"
+            # Feed bytes straight to the parser — skips the decode pass
+            data = json.loads(f.read_bytes())
+            if not isinstance(data, dict):
+                raise ValueError("Root is not a JSON object")
+            if verbose:
+                title = data.get("title", "?")
+                ch_count = len(data.get("chapters") or [])
+                details = f"title={title!r} chapters={ch_count}"
+
+        elif kind == _KIND_MUZIK:
+            file_type = "muzik"
+            data = read_muzik_metadata(f)
+            if not isinstance(data, dict):
+                raise ValueError("Root is not a JSON object")
+            if not data.get("source"):
+                warnings.append("missing source")
+            if not data.get("source_id"):
+                warnings.append("missing source_id")
+            if verbose:
+                quality_details, quality_warnings = _metadata_quality_details(data)
+                warnings.extend(quality_warnings)
+                warnings.extend(_album_completeness_warnings(f, data))
+                details = quality_details or f"source={data.get('source', '?')}"
+            else:
+                warnings.extend(_album_completeness_warnings(f, data))
+
+    except Exception as exc:
+        return file_type, "fail", str(exc)[:80]
+
+    if warnings:
+        if verbose:
+            suffix = "; ".join(warnings)
+            details = f"{details}; {suffix}" if details else suffix
+        return file_type, "warn", details
+
+    return file_type, "ok", details
+
+
 def validate_cmd(
     path: Path = typer.Argument(..., help="File or directory to validate."),
     recursive: bool = typer.Option(
@@ -112,28 +257,20 @@ def validate_cmd(
         err(f"[red]Not found: {path}[/red]")
         raise typer.Exit(1)
 
-    files: list[Path] = []
+    # Only care about known file types
     if path.is_file():
-        files = [path]
-    elif recursive:
-        files = sorted(path.rglob("*"))
+        kind = _kind(path.name)
+        relevant = [(path, kind)] if kind is not None else []
     else:
-        files = sorted(p for p in path.iterdir() if p.is_file())
-
-    # Only care about known file types
-    relevant = [
-        f
-        for f in files
-        if f.suffix.lower() in AUDIO_EXTENSIONS
-        or f.name.endswith(".chapters.txt")
-        or f.name.endswith(".info.json")
-        or f.name.endswith(".muzik.json")
-    ]
+        relevant = sorted(_walk_relevant(path, recursive))
 
     if not relevant:
         console.print("[yellow]No relevant files found.[/yellow]")
         raise typer.Exit(0)
 
+    # Deferred — rich.table is only needed once there is something to show
+    from rich.table import Table
+
     table = Table(
         title=f"Validation — {path}",
         show_header=True,
@@ -150,88 +287,28 @@ def validate_cmd(
     invalid_count = 0
     warn_count = 0
 
-    for f in relevant:
-        status = "[green]OK[/green]"
-        details = ""
-        file_type = ""
-        warnings: list[str] = []
-
-        try:
-            if f.suffix.lower() in AUDIO_EXTENSIONS:
-                file_type = "audio"
-                data = probe(f)
-                metadata = read_muzik_metadata(f)
-                if verbose:
-                    fmt = data.get("format", {})
-                    streams = data.get("streams", [{}])
-                    codec = streams[0].get("codec_name", "?") if streams else "?"
-                    dur = float(fmt.get("duration", 0))
-                    mm, ss = divmod(int(dur), 60)
-                    hh, mm = divmod(mm, 60)
-                    quality_details, warnings = _audio_quality_details(f, metadata)
-                    details = (
-                        f"codec={codec} dur={hh:02d}:{mm:02d}:{ss:02d} "
-                        f"{quality_details}"
-                    )
-                elif metadata is None:
-                    warnings.append("metadata sidecar missing")
-
-            elif f.name.endswith(".chapters.txt"):
-                file_type = "chapters"
-                chapters = parse_chapters_txt(f)
-                if not chapters:
-                    raise ValueError("No valid chapter lines found")
-                if verbose:
-                    details = f"{len(chapters)} chapters"
-
-            elif f.name.endswith(".info.json"):
-                file_type = "info.json"
-                import json
-
-                data = json.loads(f.read_text(encoding="utf-8", errors="replace"))
-                if not isinstance(data, dict):
-                    raise ValueError("Root is not a JSON object")
-                if verbose:
-                    title = data.get("title", "?")
-                    ch_count = len(data.get("chapters") or [])
-                    details = f"title={title!r} chapters={ch_count}"
-
-            elif f.name.endswith(".muzik.json"):
-                file_type = "muzik"
-                data = read_muzik_metadata(f)
-                if not isinstance(data, dict):
-                    raise ValueError("Root is not a JSON object")
-                if not data.get("source"):
-                    warnings.append("missing source")
-                if not data.get("source_id"):
-                    warnings.append("missing source_id")
-                if verbose:
-                    quality_details, quality_warnings = _metadata_quality_details(data)
-                    warnings.extend(quality_warnings)
-                    warnings.extend(_album_completeness_warnings(f, data))
-                    details = quality_details or f"source={data.get('source', '?')}"
-                else:
-                    warnings.extend(_album_completeness_warnings(f, data))
-
-            if warnings:
+    # ffprobe subprocesses dominate validation time — overlap their waits.
+    # executor.map preserves input order, so rows land in sorted order.
+    is_dir = path.is_dir()
+    with ThreadPoolExecutor(max_workers=min(8, len(relevant))) as pool:
+        results = pool.map(lambda fk: _validate_one(fk[0], fk[1], verbose), relevant)
+        for (f, _), (file_type, result, details) in zip(relevant, results):
+            if result == "fail":
+                status = "[red]FAIL[/red]"
+                invalid_count += 1
+            elif result == "warn":
                 status = "[yellow]WARN[/yellow]"
                 warn_count += 1
-                if verbose:
-                    suffix = "; ".join(warnings)
-                    details = f"{details}; {suffix}" if details else suffix
-
-            valid_count += 1
-
-        except Exception as exc:
-            status = "[red]FAIL[/red]"
-            details = str(exc)[:80]
-            invalid_count += 1
-
-        rel = f.relative_to(path) if path.is_dir() else f.name
-        row = [str(rel), file_type, status]
-        if verbose:
-            row.append(details)
-        table.add_row(*row)
+                valid_count += 1
+            else:
+                status = "[green]OK[/green]"
+                valid_count += 1
+
+            rel = f.relative_to(path) if is_dir else f.name
+            row = [str(rel), file_type, status]
+            if verbose:
+                row.append(details)
+            table.add_row(*row)
 
     console.print(table)
 
@@ -494,6 +494,11 @@ def workflow_cmd(
         "-f",
         help="Ignore download/split cache and reprocess from scratch.",
     ),
+    download_jobs: int = typer.Option(
+        1,
+        "--download-jobs",
+        help="Concurrent playlist downloads (they share one connection budget).",
+    ),
     metadata_source: str = typer.Option(
         "auto",
         "--metadata-source",
@@ -548,6 +553,7 @@ def workflow_cmd(
         config=config,
         keep_source=keep_source,
         force=force,
+        download_jobs=download_jobs,
         metadata_source=metadata_source,
         audio_source=audio_source,
         prefer=prefer,
@@ -557,9 +563,11 @@ def workflow_cmd(
     decisions: WorkflowDecisions = CliWorkflowDecisions(interactive=options.interactive)
     events: WorkflowEventEmitter = NullWorkflowEventEmitter()
 
-    def download_audio(url: str, output: Path, archive_file: Path | None) -> bool:
+    def download_audio(
+        url: str, output: Path, archive_file: Path | None
+    ) -> Optional[list[Path]]:
         try:
-            download_cmd(
+            return download_cmd(
                 url=url,
                 output=output,
                 format="bestaudio",
@@ -568,8 +576,7 @@ def workflow_cmd(
                 archive_file=archive_file,
             )
         except (SystemExit, typer.Exit) as exc:
-            return getattr(exc, "code", 0) == 0
-        return True
+            return [] if getattr(exc, "code", 0) == 0 else None
 
     def process_audio(audio_inputs: list[Path], pre_split_dirs: list[Path]) -> None:
         _process_audio_files(
@@ -119,7 +119,7 @@ SLSKD_DOWNLOAD_DIR = _SLSKD_SETTINGS["download_dir"]
 # ---------------------------------------------------------------------------
 
 # Supported audio file extensions
-AUDIO_EXTENSIONS = {".flac", ".mp3", ".m4a", ".opus", ".wav", ".aac"}
+AUDIO_EXTENSIONS = frozenset({".flac", ".mp3", ".m4a", ".opus", ".wav", ".aac"})
 
 # yt-dlp output template — embeds YouTube ID so bash cache keys stay compatible
 YTDLP_OUTPUT_TEMPLATE = "%(title)s [%(id)s].%(ext)s"
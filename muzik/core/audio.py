@@ -5,9 +5,12 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from muzik.core import cache as cache_mod
 from muzik.core.metadata import find_muzik_metadata
 from muzik.core.runner import run_silent
 
+_YEAR_RE = re.compile(r"[\(\[]((?:19|20)\d{2})[\)\]]")
+
 
 def _parse_title(title: str) -> tuple[str, str, str]:
     """Best-effort parse of ``"Artist - Album (Year)"`` YouTube title patterns.
@@ -15,11 +18,23 @@ def _parse_title(title: str) -> tuple[str, str, str]:
     Returns ``(artist, album, year)`` — any part may be empty string.
     """
     artist = album = year = ""
-    # Strip trailing year like " (1998)" or " [2004]"
-    year_match = re.search(r"[\(\[]((?:19|20)\d{2})[\)\]]", title)
-    if year_match:
-        year = year_match.group(1)
-        title = title[: year_match.start()].rstrip()
+    # Strip trailing year like " (1998)" or " [2004]". The common case is a
+    # bracketed year at the very end — a few slice checks beat the regex
+    # engine there; interior tags still fall through to the search.
+    if (
+        len(title) >= 6
+        and title[-1] in ")]"
+        and title[-6] in "(["
+        and title[-5:-3] in ("19", "20")
+        and title[-5:-1].isdigit()
+    ):
+        year = title[-5:-1]
+        title = title[:-6].rstrip()
+    else:
+        year_match = _YEAR_RE.search(title)
+        if year_match:
+            year = year_match.group(1)
+            title = title[: year_match.start()].rstrip()
 
     if " - " in title:
         parts = title.split(" - ", 1)
@@ -53,10 +68,38 @@ def probe(path: Path) -> dict:
     return json.loads(result.stdout)
 
 
+def probe_cached(path: Path) -> dict:
+    """Like :func:`probe`, but memoized on disk.
+
+    The cache entry is keyed on the resolved path and validated against the
+    file's current ``(st_mtime_ns, st_size)``, so an edited or replaced file
+    always gets a fresh ffprobe run. Audio files are effectively immutable
+    once downloaded, which makes repeat validations near-instant.
+    """
+    stat = path.stat()
+    key = f"probe_{cache_mod.stable_hash(str(path.resolve()))}"
+
+    cached = cache_mod.get_json(key)
+    if (
+        cached
+        and cached.get("mtime_ns") == stat.st_mtime_ns
+        and cached.get("size") == stat.st_size
+        and isinstance(cached.get("data"), dict)
+    ):
+        return cached["data"]
+
+    data = probe(path)
+    cache_mod.set_json(
+        key,
+        {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data},
+    )
+    return data
+
+
 def get_duration(path: Path) -> Optional[float]:
     """Return audio duration in seconds, or None on failure."""
     try:
-        data = probe(path)
+        data = probe_cached(path)
         return float(data["format"]["duration"])
     except (KeyError, ValueError, TypeError):
         return None
@@ -112,8 +155,13 @@ def extract_metadata(path: Path) -> dict:
     info_path = base.with_suffix(".info.json")
 
     if info_path.exists():
+        # Narrow handling: only a genuinely unreadable/corrupt sidecar may
+        # fall through to the ffprobe subprocess below
         try:
             data = json.loads(info_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            data = None
+        if isinstance(data, dict):
             title: str = data.get("title") or path.stem
             artist: str = data.get("artist") or ""
             uploader: str = data.get("uploader") or "Unknown Artist"
@@ -137,12 +185,10 @@ def extract_metadata(path: Path) -> dict:
                 "album": album,
                 "year": year,
             }
-        except Exception:
-            pass
 
     # Fallback: ffprobe embedded tags
     try:
-        data = probe(path)
+        data = probe_cached(path)
         tags: dict = data.get("format", {}).get("tags", {})
         # ffprobe tags are case-insensitive in practice; normalise to lower
         tags = {k.lower(): v for k, v in tags.items()}
@@ -2,9 +2,10 @@
 
 import hashlib
 import json
-from datetime import datetime, timedelta
+import os
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from muzik.config import CACHE_DIR
 
@@ -47,6 +48,33 @@ def set_json(key: str, data: dict) -> None:
     set(key, json.dumps(data, indent=2), ext="json")  # noqa: A001
 
 
+def append_json(key: str, delta: dict) -> None:
+    """Append one JSON line to the ``{key}.jsonl`` journal."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with _path(key, "jsonl").open("a") as fh:
+        fh.write(json.dumps(delta, separators=(",", ":")) + "\n")
+
+
+def iter_json_lines(key: str) -> Iterator[dict]:
+    """Yield journal entries from ``{key}.jsonl``, oldest first.
+
+    Corrupt lines (e.g. a torn tail write from an interrupted run) are
+    skipped rather than raised.
+    """
+    p = _path(key, "jsonl")
+    if not p.exists():
+        return
+    for raw in p.read_bytes().splitlines():
+        if not raw.strip():
+            continue
+        try:
+            entry = json.loads(raw)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(entry, dict):
+            yield entry
+
+
 def exists(key: str, ext: str = "txt") -> bool:
     return _path(key, ext).exists()
 
@@ -59,11 +87,44 @@ def delete(key: str, ext: str = "txt") -> bool:
     return False
 
 
+def delete_any(key: str) -> list[str]:
+    """Delete every cache file for *key* regardless of extension.
+
+    Returns the deleted filenames. One directory scan instead of an
+    exists()+unlink() pair per known extension.
+    """
+    prefix = f"{key}."
+    matches = [entry for entry in iter_all() if entry.name.startswith(prefix)]
+    for entry in matches:
+        os.unlink(entry.path)
+    return [entry.name for entry in matches]
+
+
 # ---------------------------------------------------------------------------
 # Directory-level operations
 # ---------------------------------------------------------------------------
 
 
+def iter_all() -> Iterator[os.DirEntry]:
+    """Yield cache files as os.DirEntry objects (unordered, stat-cached)."""
+    if not CACHE_DIR.exists():
+        return
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry
+
+
+def count_and_size() -> tuple[int, int]:
+    """Return (file count, total bytes) from a single directory scan."""
+    count = 0
+    total = 0
+    for entry in iter_all():
+        count += 1
+        total += entry.stat().st_size
+    return count, total
+
+
 def list_all() -> list[Path]:
     """Return all cache files sorted newest-first."""
     if not CACHE_DIR.exists():
@@ -77,17 +138,17 @@ def list_all() -> list[Path]:
 
 def total_size() -> int:
     """Total size of all cache files in bytes."""
-    return sum(p.stat().st_size for p in list_all())
+    return sum(entry.stat().st_size for entry in iter_all())
 
 
 def clean(max_age_days: int = 30) -> int:
     """Remove empty files and files older than *max_age_days*. Returns count removed."""
-    cutoff = datetime.now() - timedelta(days=max_age_days)
+    cutoff_ts = time.time() - max_age_days * 86400.0
     removed = 0
-    for p in list_all():
-        mtime = datetime.fromtimestamp(p.stat().st_mtime)
-        if p.stat().st_size == 0 or mtime < cutoff:
-            p.unlink()
+    for entry in iter_all():
+        st = entry.stat()
+        if st.st_size == 0 or st.st_mtime < cutoff_ts:
+            os.unlink(entry.path)
             removed += 1
     return removed
 
@@ -98,12 +159,24 @@ def clean(max_age_days: int = 30) -> int:
 
 
 def file_hash(path: Path) -> str:
-    """SHA-256 hash of file contents (hex digest)."""
-    h = hashlib.sha256()
+    """SHA-256 hash of file contents (hex digest).
+
+    Digests are memoized in the cache keyed on the file's
+    ``(dev, inode, mtime_ns, size)``, so repeat runs over unchanged
+    multi-GB audio files cost a single stat instead of a full read.
+    """
+    st = os.stat(path)
+    stat_key = [st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size]
+    key = f"hash_{stable_hash(str(path.resolve()))}"
+
+    cached = get_json(key)
+    if cached and cached.get("stat") == stat_key:
+        return cached["sha256"]
+
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(65536), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+    set_json(key, {"stat": stat_key, "sha256": digest})
+    return digest
 
 
 def split_cache_key(audio_path: Path, chapters_path: Path) -> str:
@@ -7,20 +7,25 @@ Supported formats
 .cue sidecar           — common album cue sheet with ``TRACK``/``INDEX 01`` entries
 """
 
+import functools
 import json
+import os
 import re
 import unicodedata
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Optional
 
+from muzik.core import cache as cache_mod
+
 
 # ---------------------------------------------------------------------------
 # Data model
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Chapter:
     index: int  # 1-based track number
     start: int  # seconds from start of file
@@ -62,6 +67,7 @@ def _ts_to_secs(ts: str) -> int:
     raise ValueError(f"Cannot parse timestamp: {ts!r}")
 
 
+@functools.lru_cache(maxsize=4096)
 def _secs_to_ts(secs: int) -> str:
     """Convert integer seconds to ``HH:MM:SS``."""
     h = secs // 3600
@@ -74,7 +80,22 @@ def _secs_to_ts(secs: int) -> str:
 # Parsers
 # ---------------------------------------------------------------------------
 
-_CHAPTER_RE = re.compile(r"^(\d+:\d{2}(?::\d{2})?)\s+(.+)$")
+# Public — validate uses this for a cheap "any chapter line?" sniff.
+# The alternation accepts the same shapes as before (H:MM:SS or M:SS) but
+# captures the numeric fields so parsers can do integer math directly
+# instead of re-splitting the matched timestamp. MULTILINE lets
+# parse_chapters_txt scan a whole file in one finditer pass, so the
+# per-line strip moves into the pattern: padding around the fields is
+# non-newline whitespace, so CRLF endings and padded lines work too. The
+# greedy title group must end on \S, which strips trailing whitespace for
+# free and rejects timestamp-only lines.
+CHAPTER_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:(\d+):(\d{2})|(\d+)):(\d{2})[^\S\n]+(.*\S)", re.MULTILINE
+)
+# Runs of unsafe characters, whitespace and dashes, handled in one pass:
+# a run containing any separator collapses to a hyphen, a run of only
+# unsafe characters disappears
+_SLUG_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f\s-]+')
 _CUE_TRACK_RE = re.compile(r"^\s*TRACK\s+(\d+)\s+\S+", re.IGNORECASE)
 _CUE_TITLE_RE = re.compile(r'^\s*TITLE\s+"?(.*?)"?\s*$', re.IGNORECASE)
 _CUE_INDEX_RE = re.compile(r"^\s*INDEX\s+01\s+(\d{2}):(\d{2}):(\d{2})", re.IGNORECASE)
@@ -86,14 +107,15 @@ def parse_chapters_txt(path: Path) -> list[Chapter]:
     Each valid line is ``HH:MM:SS Title`` or ``MM:SS Title``.
     Returns chapters with end times derived from successive start times.
     """
+    text = path.read_text(encoding="utf-8", errors="replace")
     raw: list[tuple[int, str]] = []
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        m = _CHAPTER_RE.match(line)
-        if m:
-            raw.append((_ts_to_secs(m.group(1)), m.group(2).strip()))
+    for m in CHAPTER_LINE_RE.finditer(text):
+        hours, hm_minutes, bare_minutes, seconds, title = m.groups()
+        if hours is not None:
+            start = int(hours) * 3600 + int(hm_minutes) * 60 + int(seconds)
+        else:
+            start = int(bare_minutes) * 60 + int(seconds)
+        raw.append((start, title))
 
     chapters: list[Chapter] = []
     for idx, (start, title) in enumerate(raw):
@@ -123,12 +145,7 @@ def parse_chapters_json(path: Path) -> list[Chapter]:
     # Fill missing end times from the next chapter's start
     for i in range(len(chapters) - 1):
         if chapters[i].end is None:
-            chapters[i] = Chapter(
-                index=chapters[i].index,
-                start=chapters[i].start,
-                end=chapters[i + 1].start,
-                title=chapters[i].title,
-            )
+            chapters[i].end = chapters[i + 1].start
     return chapters
 
 
@@ -200,39 +217,136 @@ def parse_cue(path: Path) -> list[Chapter]:
 # ---------------------------------------------------------------------------
 
 
-def find_chapters(audio_path: Path) -> list[Chapter]:
-    """Locate and parse chapters for *audio_path*.
+_DIR_NAMES_CACHE: dict[str, tuple[int, frozenset[str]]] = {}
 
-    Search order:
-    1. ``<stem>.chapters.txt`` sidecar
-    2. ``<stem>.info.json`` sidecar (yt-dlp)
-    3. ``<stem>.cue`` sidecar, then a single ``*.cue`` in the same directory
-    Returns an empty list when nothing is found.
+
+def _dir_names(parent: Path) -> frozenset[str]:
+    """Return the file names in *parent*, cached on the directory's mtime.
+
+    Sidecar discovery over a large library otherwise pays several
+    ``exists()`` syscalls per audio file; with this, unchanged directories
+    cost one stat. A download dropping new sidecars in bumps the
+    directory mtime and invalidates the cached listing.
     """
+    try:
+        mtime_ns = parent.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    key = str(parent)
+    cached = _DIR_NAMES_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with os.scandir(parent) as entries:
+        names = frozenset(entry.name for entry in entries)
+    _DIR_NAMES_CACHE[key] = (mtime_ns, names)
+    return names
+
+
+def _find_chapters_uncached(audio_path: Path) -> tuple[list[Chapter], Optional[Path]]:
+    """Parse chapters for *audio_path*, returning (chapters, source sidecar)."""
     base = audio_path.with_suffix("")
+    names = _dir_names(audio_path.parent)
 
     txt = base.with_suffix(".chapters.txt")
-    if txt.exists() and txt.stat().st_size > 0:
-        return parse_chapters_txt(txt)
+    if txt.name in names and txt.stat().st_size > 0:
+        return parse_chapters_txt(txt), txt
 
     jsn = base.with_suffix(".info.json")
-    if jsn.exists():
+    if jsn.name in names:
         chapters = parse_chapters_json(jsn)
         if chapters:
-            return chapters
+            return chapters, jsn
 
     cue = base.with_suffix(".cue")
-    cue_candidates = [cue] if cue.exists() else []
-    if not cue_candidates and audio_path.parent.exists():
-        cue_candidates = sorted(audio_path.parent.glob("*.cue"))
+    cue_candidates = [cue] if cue.name in names else []
+    if not cue_candidates:
+        cue_candidates = sorted(
+            audio_path.parent / name for name in names if name.endswith(".cue")
+        )
         if len(cue_candidates) != 1:
             cue_candidates = []
     for cue_path in cue_candidates:
         chapters = parse_cue(cue_path)
         if chapters:
-            return chapters
+            return chapters, cue_path
+
+    return [], None
+
+
+def _outranked(audio_path: Path, source: Path) -> bool:
+    """True when a sidecar with higher precedence than *source* now exists.
+
+    A cached hit must not shadow a ``.chapters.txt`` (or ``.info.json``)
+    the user dropped in after the cache entry was written — the stat
+    check alone only notices changes to the recorded source itself.
+    Uses the cached directory listing, so the common case costs no
+    extra syscalls.
+    """
+    names = _dir_names(audio_path.parent)
+    base = audio_path.with_suffix("")
+    txt = base.with_suffix(".chapters.txt")
+    if source.name == txt.name:
+        return False  # already the highest-precedence source
+    if txt.name in names and txt.stat().st_size > 0:
+        return True
+    jsn = base.with_suffix(".info.json")
+    return source.name != jsn.name and jsn.name in names
 
-    return []
+
+def find_chapters(audio_path: Path) -> list[Chapter]:
+    """Locate and parse chapters for *audio_path*.
+
+    Search order:
+    1. ``<stem>.chapters.txt`` sidecar
+    2. ``<stem>.info.json`` sidecar (yt-dlp)
+    3. ``<stem>.cue`` sidecar, then a single ``*.cue`` in the same directory
+    Returns an empty list when nothing is found.
+
+    Parsed results are cached in the muzik cache keyed on the source
+    sidecar's mtime and size, so repeated probes across commands
+    (download report → archive → split) parse each sidecar once.
+    """
+    key = f"chapters_{cache_mod.stable_hash(str(audio_path.resolve()))}"
+    cached = cache_mod.get_json(key)
+    if cached:
+        source = Path(cached.get("source", ""))
+        try:
+            st = source.stat()
+        except OSError:
+            st = None
+        if (
+            st is not None
+            and st.st_mtime_ns == cached.get("mtime_ns")
+            and st.st_size == cached.get("size")
+            and not _outranked(audio_path, source)
+        ):
+            return [Chapter(**ch) for ch in cached.get("chapters", [])]
+
+    chapters, source = _find_chapters_uncached(audio_path)
+    if chapters and source is not None:
+        st = source.stat()
+        cache_mod.set_json(
+            key,
+            {
+                "source": str(source),
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "chapters": [asdict(ch) for ch in chapters],
+            },
+        )
+    return chapters
+
+
+def find_chapters_many(paths: list[Path]) -> list[list[Chapter]]:
+    """Probe chapters for many files concurrently.
+
+    Each lookup is stat/open-bound and releases the GIL, so a small thread
+    pool overlaps the filesystem latency. Results keep the order of *paths*.
+    """
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return list(pool.map(find_chapters, paths))
 
 
 # ---------------------------------------------------------------------------
@@ -250,14 +364,18 @@ def serialize_chapters(chapters: list[Chapter]) -> str:
 # ---------------------------------------------------------------------------
 
 
+def _slug_separator(match: re.Match) -> str:
+    # Control characters count as unsafe (dropped), not as separators, so
+    # only spaces and dashes in the run promote it to a hyphen
+    run = match.group()
+    return "-" if " " in run or "-" in run else ""
+
+
 def safe_filename(name: str) -> str:
     """Return an ASCII-safe filename-friendly slug."""
     # Transliterate to ASCII
     name = unicodedata.normalize("NFKD", name)
     name = name.encode("ascii", "ignore").decode("ascii")
-    # Strip filesystem-unsafe characters
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "", name)
-    # Collapse whitespace to hyphens
-    name = re.sub(r"\s+", "-", name.strip())
-    name = re.sub(r"-+", "-", name).strip("-")
+    # Drop unsafe characters and collapse whitespace/dashes to hyphens
+    name = _SLUG_RE.sub(_slug_separator, name).strip("-")
     return name.lower() or "unknown"
@@ -9,14 +9,13 @@ import json
 import os
 import re
 from pathlib import Path
-from typing import Optional
-
-from pydantic_ai import Agent
-from pydantic_ai.models.openrouter import OpenRouterModel
-from pydantic_ai.providers.openrouter import OpenRouterProvider
+from typing import TYPE_CHECKING, Optional
 
 from muzik.core.chapters import Chapter, _ts_to_secs
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
 
 _SYSTEM_PROMPT = """\
 You are a music metadata extractor.
@@ -41,10 +40,16 @@ _LINE_RE = re.compile(r"^(\d{1,2}:\d{2}(?::\d{2})?)\s+(.+)$")
 # ---------------------------------------------------------------------------
 
 
-def _make_agent() -> Optional[Agent]:
+def _make_agent() -> Optional["Agent"]:
     api_key = os.environ.get("OPENROUTER_API_KEY")
     if not api_key:
         return None
+
+    # pydantic_ai drags in the whole OpenAI client — import only when used
+    from pydantic_ai import Agent
+    from pydantic_ai.models.openrouter import OpenRouterModel
+    from pydantic_ai.providers.openrouter import OpenRouterProvider
+
     model = OpenRouterModel(
         "z-ai/glm-4.5-air:free",
         provider=OpenRouterProvider(api_key=api_key),
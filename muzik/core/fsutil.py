@@ -0,0 +1,47 @@
+"""Directory-scan helpers for hot paths.
+
+These wrap ``os.scandir`` so callers filter on ``DirEntry`` (dirent-cached
+type info, plain-string names) and only construct ``Path`` objects for
+entries that survive the filter.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator
+
+from muzik.config import AUDIO_EXTENSIONS
+
+
+def scan_audio(directory: Path) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for audio files directly under *directory*."""
+    if not directory.exists():
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (
+                entry.is_file()
+                and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS
+            ):
+                yield entry
+
+
+def audio_paths(directory: Path) -> list[Path]:
+    """Sorted audio file Paths under *directory*, from one scandir pass."""
+    return sorted(
+        (Path(entry.path) for entry in scan_audio(directory)),
+        key=lambda p: p.name,
+    )
+
+
+def subdir_names(directory: Path) -> set[str]:
+    """Names of child directories (DirEntry.is_dir avoids per-child stat)."""
+    if not directory.exists():
+        return set()
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.is_dir()}
+
+
+def is_empty_dir(directory: Path) -> bool:
+    """Emptiness check that stops at the first dirent."""
+    with os.scandir(directory) as entries:
+        return next(entries, None) is None
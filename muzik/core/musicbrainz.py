@@ -4,10 +4,13 @@ Used as a fallback when an audio file has no chapter markers but appears to be
 an album (long duration, artist/album identifiable from filename or info.json).
 """
 
+import re
+from dataclasses import asdict
 from typing import Optional
 
 import musicbrainzngs
 
+from muzik.core import cache as cache_mod
 from muzik.core.chapters import Chapter
 
 musicbrainzngs.set_useragent(
@@ -17,6 +20,59 @@ musicbrainzngs.set_useragent(
 # Minimum file duration (seconds) below which we don't try MusicBrainz
 MIN_ALBUM_DURATION = 8 * 60  # 8 minutes
 
+# Common YouTube channel suffixes that hurt artist matching
+_ARTIST_SUFFIXES = (" Project", " Band", " Trio", " Quartet", " Orchestra", " Ensemble")
+
+_PAREN_YEAR_RE = re.compile(r"\s*[\(\[](?:19|20)\d{2}[\)\]]")
+_ALBUM_NOISE_RE = re.compile(
+    r"\s*[\(\[]\s*(?:full\s+album|complete\s+album|full\s+lp|official\s+album"
+    r"|remaster(?:ed)?|deluxe(?:\s+edition)?|bonus\s+tracks?)\s*[\)\]]",
+    re.IGNORECASE,
+)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _artist_variants(artist: str) -> list[str]:
+    """Artist spellings to try, most specific first."""
+    variants = [artist]
+    for suffix in _ARTIST_SUFFIXES:
+        if artist.lower().endswith(suffix.lower()):
+            variants.append(artist[: -len(suffix)].strip())
+    return variants
+
+
+def _clean_album(album: str) -> str:
+    """Strip parenthetical years and common YouTube suffixes from *album*."""
+    cleaned = _PAREN_YEAR_RE.sub("", album).strip()
+    return _ALBUM_NOISE_RE.sub("", cleaned).strip()
+
+
+def _lookup_cache_key(artist: str, album: str, year: Optional[str]) -> str:
+    normalized = (artist.strip().lower(), album.strip().lower(), str(year or ""))
+    return f"mb_{cache_mod.stable_hash(normalized)}"
+
+
+def _cached_lookup(key: str) -> Optional[tuple[list[Chapter], str]]:
+    """Return a previously stored (chapters, title) hit, or None."""
+    cached = cache_mod.get_json(key)
+    if not cached or not isinstance(cached.get("chapters"), list):
+        return None
+    try:
+        chapters = [Chapter(**ch) for ch in cached["chapters"]]
+    except TypeError:
+        return None
+    return chapters, cached.get("title", "")
+
+
+def _store_lookup(key: str, chapters: list[Chapter], title: str) -> None:
+    cache_mod.set_json(
+        key, {"title": title, "chapters": [asdict(ch) for ch in chapters]}
+    )
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -55,14 +111,15 @@ def get_tracklist(release_id: str) -> list[dict]:
     result = musicbrainzngs.get_release_by_id(release_id, includes=["recordings"])
     release = result.get("release", {})
     tracks: list[dict] = []
-    for medium in release.get("medium-list", []):
-        for t in medium.get("track-list", []):
-            recording = t.get("recording", {})
+    append = tracks.append
+    for medium in release.get("medium-list", ()):
+        for t in medium.get("track-list", ()):
+            recording = t.get("recording") or {}
+            title = t.get("title") or recording.get("title")
             length = t.get("length") or recording.get("length")
-            tracks.append(
+            append(
                 {
-                    "title": t.get("title")
-                    or recording.get("title", f"Track {t.get('position', '?')}"),
+                    "title": title or f"Track {t.get('position', '?')}",
                     "position": int(t.get("position", 0)),
                     "length": int(length) if length else None,
                 }
@@ -101,31 +158,23 @@ def lookup_chapters(
     2. artist with common suffixes stripped + album
     3. album only
 
+    Successful hits are cached on disk keyed on the normalized
+    (artist, album, year) triple, so repeated lookups across a playlist
+    (and across runs) skip the rate-limited HTTP round-trips.
+
     Returns ``([], "")`` on any failure (network, not found, missing lengths).
     """
-    # Build a list of (artist, year) variants to try
-    artist_variants = [artist]
-    # Strip common YouTube channel suffixes
-    for suffix in (" Project", " Band", " Trio", " Quartet", " Orchestra", " Ensemble"):
-        if artist.lower().endswith(suffix.lower()):
-            artist_variants.append(artist[: -len(suffix)].strip())
+    cache_key = _lookup_cache_key(artist, album, year)
+    hit = _cached_lookup(cache_key)
+    if hit is not None:
+        return hit
 
-    # Clean up album name — strip parenthetical years and common YouTube suffixes
-    import re as _re
-
-    clean_album = _re.sub(r"\s*[\(\[](?:19|20)\d{2}[\)\]]", "", album).strip()
-    clean_album = _re.sub(
-        r"\s*[\(\[]\s*(?:full\s+album|complete\s+album|full\s+lp|official\s+album"
-        r"|remaster(?:ed)?|deluxe(?:\s+edition)?|bonus\s+tracks?)\s*[\)\]]",
-        "",
-        clean_album,
-        flags=_re.IGNORECASE,
-    ).strip()
+    clean_album = _clean_album(album)
 
     # Don't filter by year if it looks like an upload year (user uploaded 2019, album from 1998)
     # Just skip year to broaden the search
     queries: list[tuple[str, Optional[str]]] = []
-    for av in artist_variants:
+    for av in _artist_variants(artist):
         queries.append((av, None))
     queries.append(("", None))  # album-only fallback
 
@@ -144,6 +193,7 @@ def lookup_chapters(
                 tracks = get_tracklist(rid)
                 chapters = tracks_to_chapters(tracks)
                 if chapters:
+                    _store_lookup(cache_key, chapters, release_title)
                     return chapters, release_title
         return [], ""
     except Exception as exc:
@@ -156,24 +206,16 @@ def lookup_chapters_verbose(
     year: Optional[str] = None,
 ) -> tuple[list["Chapter"], str, str]:
     """Like ``lookup_chapters`` but also returns a diagnostic message."""
-    import re as _re
-
-    artist_variants = [artist]
-    for suffix in (" Project", " Band", " Trio", " Quartet", " Orchestra", " Ensemble"):
-        if artist.lower().endswith(suffix.lower()):
-            artist_variants.append(artist[: -len(suffix)].strip())
+    cache_key = _lookup_cache_key(artist, album, year)
+    hit = _cached_lookup(cache_key)
+    if hit is not None:
+        chapters, release_title = hit
+        return chapters, release_title, "cached MusicBrainz result"
 
-    clean_album = _re.sub(r"\s*[\(\[](?:19|20)\d{2}[\)\]]", "", album).strip()
-    clean_album = _re.sub(
-        r"\s*[\(\[]\s*(?:full\s+album|complete\s+album|full\s+lp|official\s+album"
-        r"|remaster(?:ed)?|deluxe(?:\s+edition)?|bonus\s+tracks?)\s*[\)\]]",
-        "",
-        clean_album,
-        flags=_re.IGNORECASE,
-    ).strip()
+    clean_album = _clean_album(album)
 
     queries: list[tuple[str, Optional[str]]] = []
-    for av in artist_variants:
+    for av in _artist_variants(artist):
         queries.append((av, None))
     queries.append(("", None))
 
@@ -207,6 +249,7 @@ def lookup_chapters_verbose(
                     f"  {release_title!r}: tracks found but lengths missing"
                 )
                 continue
+            _store_lookup(cache_key, chapters, release_title)
             return chapters, release_title, "\n".join(diag_lines)
         return [], "", "\n".join(diag_lines)
     except Exception as exc:
@@ -1,15 +1,18 @@
 """Subprocess helpers for external tools.
 
 Three strategies:
-- run_streaming()   — yt-dlp: Popen + thread reader + Rich Live (last-line display)
+- run_streaming()   — yt-dlp: Popen + non-blocking pipe reads + Rich Live (last-line display)
 - run_passthrough() — beet import: inherit stdin/stdout so interactive prompts work
 - run_silent()      — ffprobe queries: capture all output, return CompletedProcess
 """
 
+import fcntl
+import os
+import selectors
 import subprocess
 import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from rich.live import Live
 from rich.text import Text
@@ -41,11 +44,14 @@ def run_streaming(
     cmd: list[str],
     cwd: Optional[Path] = None,
     label: str = "",
+    line_callback: Optional[Callable[[str], None]] = None,
 ) -> int:
     """Run *cmd*, showing the last output line via Rich Live.
 
     stdout and stderr are merged so yt-dlp progress (on stderr) is captured.
     Handles carriage-return progress lines from yt-dlp correctly.
+    If *line_callback* is given it receives every complete decoded line,
+    in order (e.g. for yt-dlp ``--print`` manifests).
     Returns the process exit code.
     """
     last = _LastLine()
@@ -66,30 +72,60 @@ def run_streaming(
         )
         return 127
 
-    def _reader() -> None:
-        assert proc.stdout is not None
+    # Read the merged pipe on this thread instead of a dedicated reader
+    # thread: a non-blocking fd plus select lets the loop sleep between
+    # bursts of yt-dlp progress output without GIL ping-pong against the
+    # Rich refresh thread.
+    assert proc.stdout is not None
+    fd = proc.stdout.fileno()
+    fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+    sel = selectors.DefaultSelector()
+    sel.register(fd, selectors.EVENT_READ)
+
+    def _pump() -> None:
         buf = b""
         while True:
-            chunk = proc.stdout.read(512)
+            if not sel.select(timeout=0.1):
+                continue
+            try:
+                chunk = os.read(fd, 8192)
+            except BlockingIOError:
+                continue
             if not chunk:
-                break
+                break  # writer closed the pipe — process is done
             buf += chunk
             # Split on \r and \n; show the last non-empty segment
             parts = buf.replace(b"\r", b"\n").split(b"\n")
             buf = parts[-1]  # keep incomplete last part for next iteration
+            if line_callback is not None:
+                for part in parts[:-1]:
+                    text = part.decode("utf-8", errors="replace").strip()
+                    if text:
+                        line_callback(text)
             for part in reversed(parts[:-1]):
                 text = part.decode("utf-8", errors="replace").strip()
                 if text:
                     last.text = text
                     break
 
-    t = threading.Thread(target=_reader, daemon=True)
-    t.start()
-
-    with Live(last, console=console, refresh_per_second=10, transient=True):
-        proc.wait()
-        t.join()
-
+    # Only the main thread may own a live display. The playlist pipeline
+    # runs downloads on producer threads while the main thread drives
+    # split's Progress on the same console; a second Live nests silently
+    # (it never renders) and out-of-order cross-thread stops pop the wrong
+    # entry off the console's live stack, killing later rendering. The
+    # same applies when any live display is already active here.
+    on_main_thread = threading.current_thread() is threading.main_thread()
+    try:
+        if not on_main_thread or console._live_stack:
+            _pump()  # headless — another display owns the terminal
+        else:
+            with Live(last, console=console, refresh_per_second=10, transient=True):
+                _pump()
+    finally:
+        sel.close()
+
+    proc.wait()
     return proc.returncode
 
 
@@ -123,9 +159,19 @@ def run_silent(
     Use this for ffprobe queries where you want the raw stdout/stderr.
     Returns the CompletedProcess (check .returncode, .stdout, .stderr).
     """
-    return subprocess.run(
+    # Capture bytes and decode once ourselves: text=True routes through the
+    # locale codec's incremental decoder machinery, which is measurable
+    # overhead on frequent small ffprobe calls, and the tools we wrap all
+    # emit UTF-8 regardless of locale anyway.
+    result = subprocess.run(
         cmd,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         cwd=cwd,
     )
+    return subprocess.CompletedProcess(
+        result.args,
+        result.returncode,
+        stdout=result.stdout.decode("utf-8", errors="replace"),
+        stderr=result.stderr.decode("utf-8", errors="replace"),
+    )
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 from typing import Optional
 
 from muzik.config import AUDIO_EXTENSIONS, CACHE_DIR, YTDLP_OUTPUT_TEMPLATE
 from muzik.core import cache as cache_mod
+from muzik.core.fsutil import audio_paths
 from muzik.core.metadata import write_muzik_metadata
 from muzik.core.runner import run_silent, run_streaming
 from muzik.core.sources.base import (
@@ -23,6 +25,8 @@ from muzik.core.sources.base import (
 
 YOUTUBE_ID_RE = re.compile(r"(?:v=|youtu\.be/|/v/|/embed/)([A-Za-z0-9_-]{11})")
 YOUTUBE_PLAYLIST_RE = re.compile(r"[?&]list=([A-Za-z0-9_-]+)")
+FILENAME_ID_RE = re.compile(r"\[([A-Za-z0-9_-]{11})\]")
+BARE_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
 
 
 def youtube_id(url: str) -> Optional[str]:
@@ -39,7 +43,7 @@ def playlist_id(url: str) -> Optional[str]:
 
 def video_id_from_path(path: Path) -> Optional[str]:
     """Extract a YouTube ID from filenames like `Title [ID].flac`."""
-    match = re.search(r"\[([A-Za-z0-9_-]{11})\]", path.stem)
+    match = FILENAME_ID_RE.search(path.stem)
     return match.group(1) if match else None
 
 
@@ -61,6 +65,9 @@ def build_download_command(
         quality,
         "--embed-metadata",
         "--add-metadata",
+        # yt-dlp backdates output files to the upload date by default,
+        # which would hide fresh downloads from the mtime watermark scan
+        "--no-mtime",
         "--output",
         YTDLP_OUTPUT_TEMPLATE,
     ]
@@ -74,35 +81,49 @@ def build_download_command(
 
 def audio_files_in(directory: Path) -> list[Path]:
     """Return supported audio files directly under *directory*."""
-    if not directory.exists():
-        return []
-    return sorted(
-        file
-        for file in directory.iterdir()
-        if file.is_file() and file.suffix.lower() in AUDIO_EXTENSIONS
-    )
+    return audio_paths(directory)
 
 
-def new_audio_files(before: set[Path], after: set[Path]) -> list[Path]:
-    """Return audio files present in *after* but not *before*."""
-    return sorted(
-        file
-        for file in (after - before)
-        if file.is_file() and file.suffix.lower() in AUDIO_EXTENSIONS
-    )
+def mtime_watermark(directory: Path) -> int:
+    """Return the newest ``st_mtime_ns`` in *directory* (0 when empty)."""
+    with os.scandir(directory) as entries:
+        return max(
+            (entry.stat().st_mtime_ns for entry in entries if entry.is_file()),
+            default=0,
+        )
+
+
+def audio_files_newer_than(directory: Path, watermark: int) -> list[Path]:
+    """Return audio files whose mtime is past *watermark*, sorted.
+
+    One scandir pass using the watermark taken before a download, instead
+    of materializing before/after Path sets and diffing them.
+    """
+    matches: list[Path] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.stat().st_mtime_ns > watermark:
+                path = Path(entry.path)
+                if path.suffix.lower() in AUDIO_EXTENSIONS:
+                    matches.append(path)
+    return sorted(matches)
 
 
 def find_audio_by_id(directory: Path, yt_id: str) -> list[Path]:
     """Return audio files whose filename contains the YouTube ID."""
     if not directory.exists():
         return []
-    return sorted(
-        file
-        for file in directory.iterdir()
-        if file.is_file()
-        and file.suffix.lower() in AUDIO_EXTENSIONS
-        and f"[{yt_id}]" in file.name
-    )
+    # Cheap substring test first so non-matching entries skip the stat and
+    # Path allocation entirely
+    tag = f"[{yt_id}]"
+    matches: list[Path] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if tag in entry.name and entry.is_file():
+                path = Path(entry.path)
+                if path.suffix.lower() in AUDIO_EXTENSIONS:
+                    matches.append(path)
+    return sorted(matches)
 
 
 def get_playlist_video_ids(url: str) -> list[str]:
@@ -113,25 +134,67 @@ def get_playlist_video_ids(url: str) -> list[str]:
     return [line.strip() for line in result.stdout.splitlines() if line.strip()]
 
 
+def _cached_archive_ids() -> set[str]:
+    """Return video IDs that have legacy ``yt_<id>`` cache entries.
+
+    The glob over CACHE_DIR is memoized in ``archive_index.json`` keyed on
+    the directory's mtime_ns: IDs live in filenames, and creating or
+    removing a cache entry bumps the directory mtime, so a matching index
+    means the scan can be skipped entirely.
+    """
+    index_path = CACHE_DIR / "archive_index.json"
+    try:
+        dir_mtime = os.stat(CACHE_DIR).st_mtime_ns
+    except OSError:
+        return set()
+
+    try:
+        index = json.loads(index_path.read_bytes())
+        if index.get("mtime_ns") == dir_mtime:
+            return set(index.get("ids", []))
+    except (OSError, ValueError):
+        pass
+
+    # scandir via iter_all keeps this to name checks on cached d_type
+    # entries instead of a stat per glob match
+    ids = sorted(
+        entry.name[3:-4]
+        for entry in cache_mod.iter_all()
+        if entry.name.startswith("yt_")
+        and entry.name.endswith(".txt")
+        and BARE_ID_RE.fullmatch(entry.name[3:-4])
+    )
+    # Creating the index bumps the directory mtime, so make sure the file
+    # exists first, then record the post-creation mtime with an in-place
+    # write (which leaves the directory mtime alone)
+    if not index_path.exists():
+        index_path.touch()
+    index_path.write_text(
+        json.dumps({"mtime_ns": os.stat(CACHE_DIR).st_mtime_ns, "ids": ids})
+    )
+    return set(ids)
+
+
 def prepopulate_archive(archive_file: Path) -> None:
     """Seed a yt-dlp archive from legacy `yt_<id>` cache entries."""
     existing: set[str] = set()
     if archive_file.exists():
-        for line in archive_file.read_text().splitlines():
-            parts = line.strip().split()
+        # Bulk bytes read + split beats decoding line-by-line. Lines are
+        # almost always b"youtube <11-char-id>" — slice that shape directly
+        # and only fall back to a whitespace split for anything else.
+        for raw in archive_file.read_bytes().splitlines():
+            if len(raw) == 19 and raw.startswith(b"youtube "):
+                existing.add(raw[8:].decode("ascii"))
+                continue
+            parts = raw.split()
             if len(parts) >= 2:
-                existing.add(parts[1])
-
-    new_lines: list[str] = []
-    for path in CACHE_DIR.glob("yt_*.txt"):
-        vid_id = path.stem[3:]
-        if re.fullmatch(r"[A-Za-z0-9_-]{11}", vid_id) and vid_id not in existing:
-            new_lines.append(f"youtube {vid_id}\n")
+                existing.add(parts[1].decode())
 
-    if new_lines:
+    new_ids = _cached_archive_ids() - existing
+    if new_ids:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
         with archive_file.open("a") as fh:
-            fh.writelines(new_lines)
+            fh.writelines(f"youtube {vid_id}\n" for vid_id in sorted(new_ids))
 
 
 def dump_json(url: str, *, flat_playlist: bool = False) -> Optional[dict]:
@@ -214,7 +277,7 @@ class YouTubeSource:
         archive_file: Optional[Path] = None,
     ) -> DownloadResult:
         output.mkdir(parents=True, exist_ok=True)
-        before = set(output.glob("*")) if output.exists() else set()
+        watermark = mtime_watermark(output)
         url = candidate.path or candidate.source_id
         rc = run_streaming(
             build_download_command(
@@ -230,8 +293,7 @@ class YouTubeSource:
         if rc != 0:
             raise RuntimeError(f"yt-dlp exited with code {rc}")
 
-        after = set(output.glob("*")) if output.exists() else set()
-        files = new_audio_files(before, after)
+        files = audio_files_newer_than(output, watermark)
         yt_id = youtube_id(url) or candidate.source_id
         if not files and yt_id:
             files = find_audio_by_id(output, yt_id)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 import os
+import queue
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol, cast
@@ -25,6 +27,7 @@ from muzik.core.sources.youtube import (
     YouTubeSource,
     find_audio_by_id,
     playlist_id as parse_playlist_id,
+    video_id_from_path,
     youtube_id as parse_youtube_id,
 )
 from muzik.core.workflow.decisions import WorkflowDecisionError, WorkflowDecisions
@@ -57,6 +60,7 @@ class WorkflowOptions:
     config: Path | None = None
     keep_source: bool = False
     force: bool = False
+    download_jobs: int = 1
     metadata_source: str = "auto"
     audio_source: str = "youtube"
     prefer: str = "lossless"
@@ -105,7 +109,9 @@ class SplitTask:
 
 @dataclass(frozen=True, slots=True)
 class WorkflowRunOperations:
-    download_audio: Callable[[str, Path, Path | None], bool]
+    # Returns the audio files the download produced, or None on failure.
+    # An empty list means "succeeded but nothing new" (e.g. archive hit).
+    download_audio: Callable[[str, Path, Path | None], list[Path] | None]
     process_audio: Callable[[list[Path], list[Path]], None]
     acquire_soulseek: Callable[[str], list[Path]]
     prepopulate_archive: Callable[[Path], None]
@@ -176,6 +182,11 @@ def load_playlist_state(playlist_id: str) -> dict:
     state = cache_mod.get_json(f"playlist_{playlist_id}") or {}
     state.setdefault("playlist_id", playlist_id)
     state.setdefault("videos", {})
+    # Fold in journal entries left by a run that never reached compaction
+    for delta in cache_mod.iter_json_lines(f"playlist_{playlist_id}"):
+        video_id = delta.pop("vid", None)
+        if video_id:
+            state["videos"][video_id] = delta
     return state
 
 
@@ -184,6 +195,26 @@ def save_playlist_state(playlist_id: str, state: dict) -> None:
     cache_mod.set_json(f"playlist_{playlist_id}", state)
 
 
+def record_video_state(playlist_id: str, state: dict, video_id: str) -> None:
+    """Journal one video's entry instead of rewriting the whole state blob.
+
+    Per-video status transitions happen hundreds of times across a large
+    playlist; appending a one-line delta keeps each save O(delta) instead
+    of O(state). :func:`compact_playlist_state` folds the journal back
+    into the canonical JSON when the workflow finishes.
+    """
+    state["last_updated"] = datetime.now().isoformat(timespec="seconds")
+    cache_mod.append_json(
+        f"playlist_{playlist_id}", {"vid": video_id, **state["videos"][video_id]}
+    )
+
+
+def compact_playlist_state(playlist_id: str, state: dict) -> None:
+    """Rewrite the canonical state blob and truncate the journal."""
+    save_playlist_state(playlist_id, state)
+    cache_mod.delete(f"playlist_{playlist_id}", ext="jsonl")
+
+
 def backfill_playlist_entry_from_legacy_cache(
     video_id: str,
     *,
@@ -499,14 +530,6 @@ def acquire_from_soulseek(
     return result.files
 
 
-def _new_audio_files(before: set[Path], after: set[Path]) -> list[Path]:
-    return sorted(
-        path
-        for path in (after - before)
-        if path.is_file() and path.suffix.lower() in AUDIO_EXTENSIONS
-    )
-
-
 def _existing_cached_audio(cache_key: str | None) -> Path | None:
     cached_entry = cache_mod.get(cache_key) if cache_key else None
     if not cached_entry:
@@ -571,30 +594,152 @@ def _run_playlist_workflow(
             "Could not fetch playlist video IDs — check the URL and yt-dlp."
         )
 
+    if options.audio_source == "soulseek":
+        # Candidate selection may prompt the user — keep this path serial
+        for video_id in video_ids:
+            _process_playlist_soulseek_video(
+                video_id,
+                playlist_id=playlist_id,
+                playlist_state=playlist_state,
+                request=request,
+                options=options,
+                operations=operations,
+            )
+        compact_playlist_state(playlist_id, playlist_state)
+        return
+
+    # Two-stage pipeline: downloads are network-bound and split/organize is
+    # CPU/disk-bound, so worker threads fetch upcoming videos while the
+    # main thread processes finished ones. --download-jobs sets the fan-out
+    # (yt-dlp runs as its own process, so threads suffice); the bounded
+    # queue keeps downloads only a little ahead of processing, and all
+    # state writes and interactive chapter prompts stay on the main thread.
+    jobs = max(1, options.download_jobs)
+    known_files = _index_output_by_id(request.output)
+    pending_ids: queue.Queue[str] = queue.Queue()
     for video_id in video_ids:
-        _process_playlist_video(
-            video_id,
+        pending_ids.put(video_id)
+    prepared_videos: queue.Queue[_PreparedVideo | None] = queue.Queue(
+        maxsize=max(2, jobs)
+    )
+    producer_errors: list[BaseException] = []
+
+    def _produce() -> None:
+        while True:
+            try:
+                video_id = pending_ids.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                prepared = _prepare_playlist_video(
+                    video_id,
+                    playlist_state=playlist_state,
+                    request=request,
+                    options=options,
+                    archive_file=archive_file,
+                    known_files=known_files,
+                    operations=operations,
+                )
+            except BaseException as exc:  # re-raised on the main thread
+                producer_errors.append(exc)
+                return
+            if prepared is not None:
+                prepared_videos.put(prepared)
+
+    producers = [
+        threading.Thread(target=_produce, name=f"playlist-download-{i}", daemon=True)
+        for i in range(min(jobs, len(video_ids)))
+    ]
+    for producer in producers:
+        producer.start()
+
+    def _close() -> None:
+        for producer in producers:
+            producer.join()
+        prepared_videos.put(None)
+
+    threading.Thread(target=_close, name="playlist-download-close", daemon=True).start()
+
+    while (prepared := prepared_videos.get()) is not None:
+        _finish_playlist_video(
+            prepared,
             playlist_id=playlist_id,
             playlist_state=playlist_state,
-            request=request,
             options=options,
-            archive_file=archive_file,
             operations=operations,
-            events=events,
         )
+    compact_playlist_state(playlist_id, playlist_state)
+    if producer_errors:
+        raise producer_errors[0]
 
 
-def _process_playlist_video(
+def _process_playlist_soulseek_video(
     video_id: str,
     *,
     playlist_id: str,
     playlist_state: dict,
     request: WorkflowRequest,
     options: WorkflowOptions,
-    archive_file: Path,
     operations: WorkflowRunOperations,
-    events: WorkflowEventEmitter,
 ) -> None:
+    entry = _playlist_entry(video_id, playlist_state, request, options)
+    if entry.get("status") == "organized":
+        return
+
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    files_for_video = _cached_playlist_files(entry)
+    if not files_for_video:
+        try:
+            files_for_video = operations.acquire_soulseek(video_url)
+        except WorkflowServiceError:
+            return
+        playlist_state["videos"][video_id] = {
+            "status": "downloaded",
+            "source": "soulseek",
+            "files": [str(path.resolve()) for path in files_for_video],
+        }
+        record_video_state(playlist_id, playlist_state, video_id)
+
+    operations.process_audio(files_for_video, [])
+    if not options.no_organize:
+        playlist_state["videos"][video_id]["status"] = "organized"
+        record_video_state(playlist_id, playlist_state, video_id)
+
+
+def _index_output_by_id(directory: Path) -> dict[str, Path]:
+    """Map YouTube IDs to audio files with a single directory scan.
+
+    Per-video ``find_audio_by_id`` fallbacks would re-read the output
+    directory once per track; the index pays the listing cost once and is
+    updated in place as downloads land.
+    """
+    index: dict[str, Path] = {}
+    if not directory.exists():
+        return index
+    for file in sorted(directory.iterdir()):
+        if file.is_file() and file.suffix.lower() in AUDIO_EXTENSIONS:
+            vid = video_id_from_path(file)
+            if vid and vid not in index:
+                index[vid] = file
+    return index
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedVideo:
+    """Download-stage result handed from the producer to the main thread."""
+
+    video_id: str
+    audio_file: Path | None = None
+    split_dir: Path | None = None
+    downloaded: bool = False
+
+
+def _playlist_entry(
+    video_id: str,
+    playlist_state: dict,
+    request: WorkflowRequest,
+    options: WorkflowOptions,
+) -> dict:
     entry = playlist_state["videos"].get(video_id, {})
     if options.force and entry.get("status") in ("split", "organized"):
         entry = {key: value for key, value in entry.items() if key != "status"}
@@ -605,73 +750,87 @@ def _process_playlist_video(
             video_id,
             splits=request.splits,
         )
+    return entry
 
-    if entry.get("status") == "organized":
-        return
 
-    video_url = f"https://www.youtube.com/watch?v={video_id}"
-    if options.audio_source == "soulseek":
-        files_for_video = _cached_playlist_files(entry)
-        if not files_for_video:
-            try:
-                files_for_video = operations.acquire_soulseek(video_url)
-            except WorkflowServiceError:
-                return
-            playlist_state["videos"][video_id] = {
-                "status": "downloaded",
-                "source": "soulseek",
-                "files": [str(path.resolve()) for path in files_for_video],
-            }
-            save_playlist_state(playlist_id, playlist_state)
-
-        operations.process_audio(files_for_video, [])
-        if not options.no_organize:
-            playlist_state["videos"][video_id]["status"] = "organized"
-            save_playlist_state(playlist_id, playlist_state)
-        return
+def _prepare_playlist_video(
+    video_id: str,
+    *,
+    playlist_state: dict,
+    request: WorkflowRequest,
+    options: WorkflowOptions,
+    archive_file: Path,
+    known_files: dict[str, Path],
+    operations: WorkflowRunOperations,
+) -> _PreparedVideo | None:
+    """Run the download stage for one playlist video.
 
-    split_dir_for_video: Path | None = None
-    audio_file: Path | None = None
+    Reads playlist state but never writes it — persistence happens in
+    :func:`_finish_playlist_video` on the consuming thread.
+    """
+    entry = _playlist_entry(video_id, playlist_state, request, options)
+
+    if entry.get("status") == "organized":
+        return None
 
     if entry.get("status") == "split":
         split_dir = Path(entry.get("split_dir", ""))
         if split_dir.exists():
-            split_dir_for_video = split_dir
+            return _PreparedVideo(video_id, split_dir=split_dir)
 
-    if split_dir_for_video is None:
-        if entry.get("status") == "downloaded":
-            cached = Path(entry["audio_file"])
-            if cached.exists():
-                audio_file = cached
+    if entry.get("status") == "downloaded":
+        cached = Path(entry["audio_file"])
+        if cached.exists():
+            return _PreparedVideo(video_id, audio_file=cached)
 
-        if audio_file is None:
-            before = set(request.output.glob("*")) if request.output.exists() else set()
-            if not operations.download_audio(video_url, request.output, archive_file):
-                return
-            after = set(request.output.glob("*")) if request.output.exists() else set()
-            new_files = _new_audio_files(before, after)
-            if not new_files:
-                new_files = find_audio_by_id(request.output, video_id)
-            if not new_files:
-                return
-            audio_file = new_files[0]
-            playlist_state["videos"][video_id] = {
-                "status": "downloaded",
-                "audio_file": str(audio_file.resolve()),
-            }
-            save_playlist_state(playlist_id, playlist_state)
-            cache_mod.set(f"yt_{video_id}", str(audio_file.resolve()))
-
-        operations.process_audio([audio_file], [])
+    video_url = f"https://www.youtube.com/watch?v={video_id}"
+    new_files = operations.download_audio(video_url, request.output, archive_file)
+    if new_files is None:
+        return None
+    if not new_files:
+        # yt-dlp reported nothing new (archive hit) — consult the index
+        indexed = known_files.get(video_id)
+        new_files = [indexed] if indexed is not None and indexed.exists() else []
+    if not new_files:
+        return None
+    known_files[video_id] = new_files[0]
+    return _PreparedVideo(video_id, audio_file=new_files[0], downloaded=True)
+
+
+def _finish_playlist_video(
+    prepared: _PreparedVideo,
+    *,
+    playlist_id: str,
+    playlist_state: dict,
+    options: WorkflowOptions,
+    operations: WorkflowRunOperations,
+) -> None:
+    """Split/organize one prepared video and persist its state transitions."""
+    video_id = prepared.video_id
+
+    if prepared.split_dir is not None:
         if not options.no_organize:
-            playlist_state["videos"][video_id]["status"] = "organized"
-            save_playlist_state(playlist_id, playlist_state)
+            operations.process_audio([], [prepared.split_dir])
+            playlist_state["videos"].setdefault(video_id, {})["status"] = "organized"
+            record_video_state(playlist_id, playlist_state, video_id)
         return
 
-    if split_dir_for_video is not None and not options.no_organize:
-        operations.process_audio([], [split_dir_for_video])
-        playlist_state["videos"][video_id]["status"] = "organized"
-        save_playlist_state(playlist_id, playlist_state)
+    if prepared.audio_file is None:
+        return
+
+    if prepared.downloaded:
+        audio_path = str(prepared.audio_file.resolve())
+        playlist_state["videos"][video_id] = {
+            "status": "downloaded",
+            "audio_file": audio_path,
+        }
+        record_video_state(playlist_id, playlist_state, video_id)
+        cache_mod.set(f"yt_{video_id}", audio_path)
+
+    operations.process_audio([prepared.audio_file], [])
+    if not options.no_organize:
+        playlist_state["videos"].setdefault(video_id, {})["status"] = "organized"
+        record_video_state(playlist_id, playlist_state, video_id)
 
 
 def _cached_playlist_files(entry: dict) -> list[Path]:
@@ -733,11 +892,10 @@ def _acquire_single_workflow_inputs(
             cache_mod.set(cache_key, str(audio_files[0]))
         return audio_files, pre_split_dirs
 
-    before = set(request.output.glob("*")) if request.output.exists() else set()
-    if not operations.download_audio(request.raw, request.output, None):
+    downloaded = operations.download_audio(request.raw, request.output, None)
+    if downloaded is None:
         raise WorkflowServiceError("Download failed. Aborting workflow.")
-    after = set(request.output.glob("*")) if request.output.exists() else set()
-    audio_files = _new_audio_files(before, after)
+    audio_files = downloaded
     if not audio_files and yt_id and request.output.exists():
         audio_files = find_audio_by_id(request.output, yt_id)
     if audio_files and cache_key:
@@ -401,9 +401,11 @@ def _default_operations(
     decisions: WorkflowDecisions,
     events: WorkflowEventEmitter,
 ) -> WorkflowRunOperations:
-    def download_audio(url: str, output: Path, archive_file: Path | None) -> bool:
+    def download_audio(
+        url: str, output: Path, archive_file: Path | None
+    ) -> list[Path] | None:
         try:
-            download_cmd(
+            return download_cmd(
                 url=url,
                 output=output,
                 format="bestaudio",
@@ -412,8 +414,7 @@ def _default_operations(
                 archive_file=archive_file,
             )
         except (SystemExit, typer.Exit) as exc:
-            return _exit_code(exc) == 0
-        return True
+            return [] if _exit_code(exc) == 0 else None
 
     def process_audio(audio_inputs: list[Path], pre_split_dirs: list[Path]) -> None:
         _process_audio_files(
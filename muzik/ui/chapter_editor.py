@@ -6,6 +6,7 @@
 3. If edit: write to NamedTemporaryFile, open $EDITOR, re-parse, repeat.
 """
 
+import functools
 import os
 import shutil
 import subprocess
@@ -45,6 +46,7 @@ def display_chapter_table(chapters: list[Chapter], title: str = "Chapters") -> N
     console.print(table)
 
 
+@functools.lru_cache(maxsize=1)
 def _find_editor() -> str:
     """Return a usable editor command."""
     for env_var in ("EDITOR", "VISUAL"):
@@ -114,19 +116,10 @@ def edit_chapters(
                     )
                 else:
                     # Re-derive end times from successive starts
+                    # (parse_chapters_txt already numbered the indexes)
                     for i in range(len(updated) - 1):
-                        updated[i] = Chapter(
-                            index=i + 1,
-                            start=updated[i].start,
-                            end=updated[i + 1].start,
-                            title=updated[i].title,
-                        )
-                    updated[-1] = Chapter(
-                        index=len(updated),
-                        start=updated[-1].start,
-                        end=None,
-                        title=updated[-1].title,
-                    )
+                        updated[i].end = updated[i + 1].start
+                    updated[-1].end = None
                     chapters = updated
                     console.print(
                         f"[green]Chapters updated ({len(chapters)} tracks).[/green]"
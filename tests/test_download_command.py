@@ -11,16 +11,21 @@ def test_download_cmd_uses_ytdlp_and_reports_new_audio(
     seen_cwd: Path | None = None
     seen_label = ""
 
-    def fake_run_streaming(cmd, *, cwd, label):
+    def fake_run_streaming(cmd, *, cwd, label, line_callback=None):
         nonlocal seen_cmd, seen_cwd, seen_label
         seen_cmd = cmd
         seen_cwd = cwd
         seen_label = label
         (cwd / "Downloaded [abcdefghijk].flac").write_bytes(b"audio")
+        if line_callback is not None:
+            # Simulate yt-dlp's --print after_move:filepath manifest
+            line_callback("Downloaded [abcdefghijk].flac")
         return 0
 
     monkeypatch.setattr(download, "run_streaming", fake_run_streaming)
-    monkeypatch.setattr(download, "find_chapters", lambda path: [])
+    monkeypatch.setattr(
+        download, "find_chapters_many", lambda paths: [[] for _ in paths]
+    )
 
     download.download_cmd(
         url="https://youtube.com/watch?v=abcdefghijk",
@@ -35,4 +40,5 @@ def test_download_cmd_uses_ytdlp_and_reports_new_audio(
     assert seen_label == "yt-dlp"
     assert "yt-dlp" == seen_cmd[0]
     assert "https://youtube.com/watch?v=abcdefghijk" == seen_cmd[-1]
+    assert "after_move:filepath" in seen_cmd
     assert (tmp_path / "Downloaded [abcdefghijk].flac").exists()
@@ -75,7 +75,7 @@ def test_pipeline_screen_runs_workflow_in_worker() -> None:
             done.set()
 
         return WorkflowRunOperations(
-            download_audio=lambda url, output, archive_file: True,
+            download_audio=lambda url, output, archive_file: [],
             process_audio=process_audio,
             acquire_soulseek=lambda raw: [],
             prepopulate_archive=lambda archive_file: None,
@@ -106,7 +106,7 @@ def test_pipeline_back_returns_to_launcher() -> None:
             done.set()
 
         return WorkflowRunOperations(
-            download_audio=lambda url, output, archive_file: True,
+            download_audio=lambda url, output, archive_file: [],
             process_audio=process_audio,
             acquire_soulseek=lambda raw: [],
             prepopulate_archive=lambda archive_file: None,
@@ -44,7 +44,7 @@ def test_validate_audio_reports_missing_metadata_warning(
 
     monkeypatch.setattr(
         validate,
-        "probe",
+        "probe_cached",
         lambda path: {
             "format": {"duration": "1.0"},
             "streams": [{"codec_name": "flac"}],
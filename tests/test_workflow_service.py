@@ -302,7 +302,7 @@ def test_run_workflow_reuses_legacy_split_cache(
     processed: list[tuple[list[Path], list[Path]]] = []
 
     operations = service.WorkflowRunOperations(
-        download_audio=lambda url, output, archive: False,
+        download_audio=lambda url, output, archive: None,
         process_audio=lambda audio, split: processed.append((audio, split)),
         acquire_soulseek=lambda request: [],
         prepopulate_archive=lambda archive: None,
@@ -410,11 +410,12 @@ def test_run_workflow_downloads_single_youtube_and_processes_audio(
     processed: list[tuple[list[Path], list[Path]]] = []
     downloads: list[tuple[str, Path | None]] = []
 
-    def download_audio(url: str, output: Path, archive_file: Path | None) -> bool:
+    def download_audio(url: str, output: Path, archive_file: Path | None) -> list[Path]:
         downloads.append((url, archive_file))
         output.mkdir(parents=True)
-        (output / "Downloaded [abcdefghijk].flac").write_bytes(b"audio")
-        return True
+        audio = output / "Downloaded [abcdefghijk].flac"
+        audio.write_bytes(b"audio")
+        return [audio]
 
     operations = service.WorkflowRunOperations(
         download_audio=download_audio,
@@ -460,7 +461,7 @@ def test_run_workflow_processes_playlist_with_soulseek(
         return [audio]
 
     operations = service.WorkflowRunOperations(
-        download_audio=lambda url, output, archive: False,
+        download_audio=lambda url, output, archive: None,
         process_audio=lambda audio, split: processed.append((audio, split)),
         acquire_soulseek=acquire,
         prepopulate_archive=lambda archive: archives.append(archive),
@@ -509,7 +510,7 @@ def test_run_workflow_skips_organized_playlist_entries(
         raise AssertionError("organized playlist entries should be skipped")
 
     operations = service.WorkflowRunOperations(
-        download_audio=lambda url, output, archive: False,
+        download_audio=lambda url, output, archive: None,
         process_audio=fail_process,
         acquire_soulseek=lambda request: [],
         prepopulate_archive=lambda archive: archives.append(archive),
@@ -196,7 +196,9 @@ def test_workflow_falls_back_to_youtube_when_soulseek_has_no_candidates(
         calls["youtube_download"] += 1
         output = kwargs["output"]
         output.mkdir(parents=True, exist_ok=True)
-        (output / "Fallback [abcdefghijk].flac").write_bytes(b"")
+        audio = output / "Fallback [abcdefghijk].flac"
+        audio.write_bytes(b"")
+        return [audio]
 
     monkeypatch.setattr(workflow, "YouTubeSource", FakeYouTubeSource)
     monkeypatch.setattr(workflow, "SoulseekSource", FakeSoulseekSource)
@@ -278,7 +280,9 @@ def test_workflow_youtube_audio_source_uses_download_cmd(
         calls.append(kwargs["url"])
         output = kwargs["output"]
         output.mkdir(parents=True, exist_ok=True)
-        (output / "Downloaded [abcdefghijk].flac").write_bytes(b"audio")
+        audio = output / "Downloaded [abcdefghijk].flac"
+        audio.write_bytes(b"audio")
+        return [audio]
 
     monkeypatch.setattr(workflow, "download_cmd", fake_download_cmd)
     monkeypatch.setattr(workflow, "find_chapters", lambda path: [])